@@ -10,95 +10,119 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; fall back to stdlib json
+    orjson = None
+
+
+class _ActionRow(dict):
+    """Action item that supplies table defaults for missing keys."""
+
+    _DEFAULTS = {"owner": "TBD", "action": "", "due_date": "TBD", "priority": "medium"}
+
+    def __init__(self, item: dict[str, Any]):
+        super().__init__(item)
+        # An empty or null due date renders like a missing one
+        if not self.get("due_date"):
+            self.pop("due_date", None)
+
+    def __missing__(self, key: str) -> str:
+        return self._DEFAULTS.get(key, "")
+
+
+_ACTION_ROW = "| {owner} | {action} | {due_date} | {priority} |\n".format_map
+
 
 def format_markdown(data: dict[str, Any]) -> str:
     """Format meeting data as Markdown."""
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
 
     # Meeting header
     meeting = data.get("meeting", {})
-    if meeting.get("title"):
-        lines.append(f"# {meeting['title']}")
-    if meeting.get("date"):
-        lines.append(f"*{meeting['date']}*")
-    lines.append("")
+    if title := meeting.get("title"):
+        write(f"# {title}\n")
+    if date := meeting.get("date"):
+        write(f"*{date}*\n")
+    write("\n")
 
     # Summary
-    lines.append("## Summary")
-    lines.append(data.get("summary", "No summary provided."))
-    lines.append("")
+    write(f"## Summary\n{data.get('summary', 'No summary provided.')}\n\n")
 
     # Attendees
-    attendees = meeting.get("attendees", [])
-    if attendees:
-        lines.append("## Attendees")
+    if attendees := meeting.get("attendees"):
+        write("## Attendees\n")
         for attendee in attendees:
-            lines.append(f"- {attendee}")
-        lines.append("")
+            write(f"- {attendee}\n")
+        write("\n")
 
     # Decisions
-    decisions = data.get("decisions", [])
-    if decisions:
-        lines.append("## Decisions")
+    if decisions := data.get("decisions"):
+        write("## Decisions\n")
         for i, decision in enumerate(decisions, 1):
             if isinstance(decision, dict):
-                lines.append(f"{i}. {decision.get('decision', '')}")
+                write(f"{i}. {decision.get('decision', '')}\n")
                 if decision.get("context"):
-                    lines.append(f"   - Context: {decision['context']}")
+                    write(f"   - Context: {decision['context']}\n")
             else:
-                lines.append(f"{i}. {decision}")
-        lines.append("")
+                write(f"{i}. {decision}\n")
+        write("\n")
 
     # Action Items
-    action_items = data.get("action_items", [])
-    if action_items:
-        lines.append("## Action Items")
-        lines.append("| Owner | Action | Due | Priority |")
-        lines.append("|-------|--------|-----|----------|")
+    if action_items := data.get("action_items"):
+        write(
+            "## Action Items\n"
+            "| Owner | Action | Due | Priority |\n"
+            "|-------|--------|-----|----------|\n"
+        )
         for item in action_items:
-            owner = item.get("owner", "TBD")
-            action = item.get("action", "")
-            due = item.get("due_date") or "TBD"
-            priority = item.get("priority", "medium")
-            lines.append(f"| {owner} | {action} | {due} | {priority} |")
-        lines.append("")
+            write(_ACTION_ROW(_ActionRow(item)))
+        write("\n")
 
     # Parking Lot
-    parking_lot = data.get("parking_lot", [])
-    if parking_lot:
-        lines.append("## Parking Lot")
+    if parking_lot := data.get("parking_lot"):
+        write("## Parking Lot\n")
         for item in parking_lot:
-            lines.append(f"- {item}")
-        lines.append("")
+            write(f"- {item}\n")
+        write("\n")
 
     # Next Meeting
-    next_meeting = data.get("next_meeting", {})
-    if next_meeting and (next_meeting.get("date") or next_meeting.get("time")):
-        lines.append("## Next Meeting")
-        parts = []
-        if next_meeting.get("date"):
-            parts.append(next_meeting["date"])
-        if next_meeting.get("time"):
-            parts.append(f"at {next_meeting['time']}")
-        lines.append(" ".join(parts))
-        agenda = next_meeting.get("agenda_items", [])
-        if agenda:
-            lines.append("")
-            lines.append("**Agenda:**")
-            for item in agenda:
-                lines.append(f"- {item}")
-        lines.append("")
-
-    return "\n".join(lines)
+    if next_meeting := data.get("next_meeting"):
+        next_date = next_meeting.get("date")
+        next_time = next_meeting.get("time")
+        if next_date or next_time:
+            write("## Next Meeting\n")
+            parts = []
+            if next_date:
+                parts.append(next_date)
+            if next_time:
+                parts.append(f"at {next_time}")
+            write(" ".join(parts) + "\n")
+            if agenda := next_meeting.get("agenda_items"):
+                write("\n**Agenda:**\n")
+                for item in agenda:
+                    write(f"- {item}\n")
+            write("\n")
+
+    # Every section ends with a blank line; drop its newline so the output
+    # ends with a single trailing newline.
+    return buf.getvalue()[:-1]
 
 
 def format_json(data: dict[str, Any]) -> str:
     """Format meeting data as pretty-printed JSON."""
+    return _render_json(data).decode()
+
+
+def _render_json(data: dict[str, Any]) -> bytes:
+    """Render meeting data as pretty-printed UTF-8 JSON."""
     # Ensure consistent structure
     output = {
         "meeting": data.get("meeting", {}),
@@ -107,9 +131,12 @@ def format_json(data: dict[str, Any]) -> str:
         "action_items": data.get("action_items", []),
         "parking_lot": data.get("parking_lot", []),
         "next_meeting": data.get("next_meeting", {}),
-        "formatted_at": datetime.utcnow().isoformat() + "Z",
+        "formatted_at": datetime.now(timezone.utc),
     }
-    return json.dumps(output, indent=2)
+    if orjson is not None:
+        return orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z)
+    output["formatted_at"] = output["formatted_at"].isoformat().replace("+00:00", "Z")
+    return json.dumps(output, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 def main():
@@ -125,25 +152,28 @@ def main():
     parser.add_argument(
         "input_file",
         nargs="?",
-        type=argparse.FileType("r"),
-        default=sys.stdin,
+        type=argparse.FileType("rb"),
+        default=sys.stdin.buffer,
         help="Input JSON file (default: stdin)"
     )
 
     args = parser.parse_args()
 
+    raw = args.input_file.read()
     try:
-        data = json.load(args.input_file)
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
     if args.format in ("markdown", "md"):
-        output = format_markdown(data)
+        output = format_markdown(data).encode("utf-8")
     else:
-        output = format_json(data)
+        output = _render_json(data)
 
-    print(output)
+    # Write bytes directly, skipping the text-mode stdout encoder
+    sys.stdout.buffer.write(output)
+    sys.stdout.buffer.write(b"\n")
 
 
 if __name__ == "__main__":
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import importlib.util
 import os
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from openharness import HarnessAdapter
@@ -41,43 +43,81 @@ ADAPTER_INFO = {
 }
 
 
-def get_available_adapters() -> list[str]:
-    """Return list of available adapter names based on installed packages."""
-    available = []
+# Adapter name -> (display name, description, package), flattened once for display code
+ADAPTER_DISPLAY: dict[str, tuple[str, str, str]] = {
+    key: (info["name"], info["description"], info["package"])
+    for key, info in ADAPTER_INFO.items()
+}
 
-    # Check Anthropic
-    try:
-        from openharness_anthropic_agent import AnthropicAgentAdapter  # noqa: F401
+# Adapter name -> top-level module of its package
+ADAPTER_MODULES = {
+    "anthropic": "openharness_anthropic_agent",
+    "letta": "openharness_letta",
+    "goose": "openharness_goose",
+    "deepagent": "openharness_deepagent",
+}
 
-        available.append("anthropic")
-    except ImportError:
-        pass
 
-    # Check Letta
-    try:
-        from openharness_letta import LettaAdapter  # noqa: F401
+@cache
+def get_available_adapters() -> tuple[str, ...]:
+    """Return available adapter names based on installed packages.
 
-        available.append("letta")
-    except ImportError:
-        pass
+    Packages are located with ``importlib.util.find_spec`` rather than
+    imported, so probing does not pay for loading vendor SDKs. The result
+    is cached for the life of the process.
+    """
+    return tuple(
+        name
+        for name, module in ADAPTER_MODULES.items()
+        if importlib.util.find_spec(module) is not None
+    )
 
-    # Check Goose
-    try:
-        from openharness_goose import GooseAdapter  # noqa: F401
 
-        available.append("goose")
-    except ImportError:
-        pass
+def _make_anthropic(**kwargs) -> HarnessAdapter:
+    from openharness_anthropic_agent import AnthropicAgentAdapter
+
+    return AnthropicAgentAdapter(
+        api_key=kwargs.get("api_key") or os.environ.get("ANTHROPIC_API_KEY"),
+        model=kwargs.get("model", "claude-sonnet-4-20250514"),
+    )
+
+
+def _make_letta(**kwargs) -> HarnessAdapter:
+    from openharness_letta import LettaAdapter
+
+    return LettaAdapter(
+        base_url=kwargs.get("base_url", "http://localhost:8283"),
+        api_key=kwargs.get("api_key"),
+    )
+
+
+def _make_goose(**kwargs) -> HarnessAdapter:
+    from openharness_goose import GooseAdapter
+
+    # Goose uses CLI by default, or REST API if GOOSE_SERVICE_URL is set
+    return GooseAdapter(
+        service_url=kwargs.get("service_url"),  # None = use CLI
+        working_directory=kwargs.get("working_directory"),
+    )
 
-    # Check Deep Agent
-    try:
-        from openharness_deepagent import DeepAgentAdapter  # noqa: F401
 
-        available.append("deepagent")
-    except ImportError:
-        pass
+def _make_deepagent(**kwargs) -> HarnessAdapter:
+    from openharness_deepagent import DeepAgentAdapter
+    from openharness_deepagent.types import DeepAgentConfig
 
-    return available
+    config = DeepAgentConfig(
+        model=kwargs.get("model", "anthropic:claude-sonnet-4-20250514"),
+    )
+    return DeepAgentAdapter(config=config)
+
+
+# Adapter name -> factory; each factory imports its package on first use
+_FACTORIES: dict[str, Callable[..., HarnessAdapter]] = {
+    "anthropic": _make_anthropic,
+    "letta": _make_letta,
+    "goose": _make_goose,
+    "deepagent": _make_deepagent,
+}
 
 
 def create_adapter(adapter_type: str, **kwargs) -> HarnessAdapter:
@@ -94,42 +134,12 @@ def create_adapter(adapter_type: str, **kwargs) -> HarnessAdapter:
         ValueError: If adapter type is unknown
         ImportError: If adapter package is not installed
     """
-    if adapter_type == "anthropic":
-        from openharness_anthropic_agent import AnthropicAgentAdapter
-
-        return AnthropicAgentAdapter(
-            api_key=kwargs.get("api_key") or os.environ.get("ANTHROPIC_API_KEY"),
-            model=kwargs.get("model", "claude-sonnet-4-20250514"),
-        )
-
-    elif adapter_type == "letta":
-        from openharness_letta import LettaAdapter
-
-        return LettaAdapter(
-            base_url=kwargs.get("base_url", "http://localhost:8283"),
-            api_key=kwargs.get("api_key"),
-        )
-
-    elif adapter_type == "goose":
-        from openharness_goose import GooseAdapter
-
-        # Goose uses CLI by default, or REST API if GOOSE_SERVICE_URL is set
-        return GooseAdapter(
-            service_url=kwargs.get("service_url"),  # None = use CLI
-            working_directory=kwargs.get("working_directory"),
-        )
-
-    elif adapter_type == "deepagent":
-        from openharness_deepagent import DeepAgentAdapter
-        from openharness_deepagent.types import DeepAgentConfig
-
-        config = DeepAgentConfig(
-            model=kwargs.get("model", "anthropic:claude-sonnet-4-20250514"),
-        )
-        return DeepAgentAdapter(config=config)
-
-    else:
+    try:
+        factory = _FACTORIES[adapter_type]
+    except KeyError:
         raise ValueError(
             f"Unknown adapter type: {adapter_type}. "
-            f"Available: anthropic, letta, goose, deepagent"
-        )
+            f"Available: {', '.join(_FACTORIES)}"
+        ) from None
+
+    return factory(**kwargs)
@@ -8,27 +8,30 @@ AI agent harnesses: Anthropic Agent SDK, Letta, Goose, and Deep Agent.
 from __future__ import annotations
 
 import asyncio
+import io
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import click
 from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-from demo.adapters import ADAPTER_INFO, create_adapter, get_available_adapters
+from demo.adapters import (
+    ADAPTER_DISPLAY,
+    ADAPTER_INFO,
+    create_adapter,
+    get_available_adapters,
+)
 
 if TYPE_CHECKING:
-    from openharness import HarnessAdapter
+    from openharness import ExecutionEvent, HarnessAdapter
 
 console = Console()
 
 
 def print_header():
     """Print the demo header."""
+    from rich.panel import Panel
+
     console.print()
     console.print(
         Panel.fit(
@@ -40,22 +43,19 @@ def print_header():
     console.print()
 
 
-def print_adapters_table(available: list[str]):
+def print_adapters_table(available: tuple[str, ...]):
     """Print table of available adapters."""
+    from rich.table import Table
+
     table = Table(title="Available Adapters", show_header=True, header_style="bold cyan")
     table.add_column("Adapter", style="bold")
     table.add_column("Package")
     table.add_column("Description")
     table.add_column("Status", justify="center")
 
-    for key, info in ADAPTER_INFO.items():
+    for key, (name, description, package) in ADAPTER_DISPLAY.items():
         status = "[green]Ready[/green]" if key in available else "[dim]Not installed[/dim]"
-        table.add_row(
-            info["name"],
-            info["package"],
-            info["description"],
-            status,
-        )
+        table.add_row(name, package, description, status)
 
     console.print(table)
     console.print()
@@ -63,6 +63,8 @@ def print_adapters_table(available: list[str]):
 
 def print_capabilities(adapter: HarnessAdapter):
     """Print adapter capabilities."""
+    from rich.table import Table
+
     caps = adapter.capabilities
 
     table = Table(title="Adapter Capabilities", show_header=True, header_style="bold cyan")
@@ -81,6 +83,19 @@ def print_capabilities(adapter: HarnessAdapter):
     console.print()
 
 
+# Non-text stream event handlers, keyed by event type. Text events are
+# handled inline by the streaming loops since they dominate the stream.
+_STREAM_HANDLERS: dict[str, Callable[[ExecutionEvent], None]] = {
+    "tool_call_start": lambda event: console.print(f"\n[dim]→ Calling tool: {event.name}[/dim]"),
+    "tool_call_end": lambda event: console.print("[dim]→ Tool completed[/dim]"),
+    "error": lambda event: console.print(f"\n[red]Error: {event.message}[/red]"),
+}
+
+_CHAT_HANDLERS: dict[str, Callable[[ExecutionEvent], None]] = {
+    "tool_call_start": lambda event: console.print(f"\n[dim]→ {event.name}[/dim]", end=""),
+}
+
+
 async def run_streaming_demo(adapter: HarnessAdapter, message: str):
     """Run a streaming execution demo."""
     from openharness import ExecuteRequest
@@ -89,20 +104,14 @@ async def run_streaming_demo(adapter: HarnessAdapter, message: str):
     console.print()
     console.print("[bold]Assistant:[/bold] ", end="")
 
-    response_text = ""
-
     try:
         async for event in adapter.execute_stream(ExecuteRequest(message=message)):
             if event.type == "text":
-                content = event.content
-                console.print(content, end="")
-                response_text += content
-            elif event.type == "tool_call_start":
-                console.print(f"\n[dim]→ Calling tool: {event.name}[/dim]")
-            elif event.type == "tool_call_end":
-                console.print(f"[dim]→ Tool completed[/dim]")
-            elif event.type == "error":
-                console.print(f"\n[red]Error: {event.message}[/red]")
+                console.print(event.content, end="")
+                continue
+            handler = _STREAM_HANDLERS.get(event.type)
+            if handler:
+                handler(event)
 
         console.print()
         console.print()
@@ -115,6 +124,7 @@ async def run_streaming_demo(adapter: HarnessAdapter, message: str):
 async def run_sync_demo(adapter: HarnessAdapter, message: str):
     """Run a synchronous execution demo."""
     from openharness import ExecuteRequest
+    from rich.markdown import Markdown
 
     console.print(f"[bold]User:[/bold] {message}")
     console.print()
@@ -135,11 +145,13 @@ async def run_sync_demo(adapter: HarnessAdapter, message: str):
 
 async def interactive_mode(adapter: HarnessAdapter, adapter_name: str):
     """Run interactive chat mode."""
-    info = ADAPTER_INFO.get(adapter_name, {})
+    from rich.panel import Panel
+
+    name, description, _ = ADAPTER_DISPLAY.get(adapter_name, (adapter_name, "", ""))
     console.print(
         Panel(
-            f"[bold]{info.get('name', adapter_name)}[/bold]\n"
-            f"[dim]{info.get('description', '')}[/dim]\n\n"
+            f"[bold]{name}[/bold]\n"
+            f"[dim]{description}[/dim]\n\n"
             "Type your message and press Enter. Type 'quit' to exit.",
             title="Interactive Mode",
             border_style="green",
@@ -166,8 +178,10 @@ async def interactive_mode(adapter: HarnessAdapter, adapter_name: str):
             async for event in adapter.execute_stream(ExecuteRequest(message=message)):
                 if event.type == "text":
                     console.print(event.content, end="")
-                elif event.type == "tool_call_start":
-                    console.print(f"\n[dim]→ {event.name}[/dim]", end="")
+                    continue
+                handler = _CHAT_HANDLERS.get(event.type)
+                if handler:
+                    handler(event)
 
             console.print("\n")
 
@@ -178,36 +192,48 @@ async def interactive_mode(adapter: HarnessAdapter, adapter_name: str):
             console.print(f"\n[red]Error: {e}[/red]\n")
 
 
-async def compare_adapters(message: str, adapters: list[str]):
-    """Compare responses across multiple adapters."""
+async def compare_adapters(message: str, adapters: list[str], timeout: float = 120):
+    """Compare responses across multiple adapters.
+
+    All adapters run concurrently; each response is buffered and printed
+    once every adapter has finished, so output is never interleaved.
+    """
     from openharness import ExecuteRequest
 
     console.print(f"[bold]Prompt:[/bold] {message}")
     console.print()
 
-    results = {}
+    async def collect(adapter_name: str) -> str:
+        adapter = create_adapter(adapter_name)
+        buffer = io.StringIO()
+        async for event in adapter.execute_stream(ExecuteRequest(message=message)):
+            if event.type == "text":
+                buffer.write(event.content)
+        return buffer.getvalue()
 
-    for adapter_name in adapters:
-        try:
-            adapter = create_adapter(adapter_name)
-            info = ADAPTER_INFO.get(adapter_name, {})
+    outcomes = await asyncio.gather(
+        *(asyncio.wait_for(collect(name), timeout) for name in adapters),
+        return_exceptions=True,
+    )
 
-            console.print(f"[bold blue]{info.get('name', adapter_name)}[/bold blue]")
-            console.print("[dim]" + "─" * 40 + "[/dim]")
+    results = {}
 
-            response = ""
-            async for event in adapter.execute_stream(ExecuteRequest(message=message)):
-                if event.type == "text":
-                    console.print(event.content, end="")
-                    response += event.content
+    for adapter_name, outcome in zip(adapters, outcomes):
+        name, _, _ = ADAPTER_DISPLAY.get(adapter_name, (adapter_name, "", ""))
 
-            console.print("\n")
-            results[adapter_name] = response
+        console.print(f"[bold blue]{name}[/bold blue]")
+        console.print("[dim]" + "─" * 40 + "[/dim]")
 
-        except ImportError:
-            console.print(f"[yellow]Skipped (not installed)[/yellow]\n")
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]\n")
+        if isinstance(outcome, ImportError):
+            console.print("[yellow]Skipped (not installed)[/yellow]\n")
+        elif isinstance(outcome, asyncio.TimeoutError):
+            console.print("[red]Timeout[/red]\n")
+        elif isinstance(outcome, Exception):
+            console.print(f"[red]Error: {outcome}[/red]\n")
+        else:
+            console.print(outcome, end="")
+            console.print("\n")
+            results[adapter_name] = outcome
 
     return results
 
@@ -243,15 +269,15 @@ def capabilities(adapter_type: str):
 
     try:
         adapter = create_adapter(adapter_type)
-        info = ADAPTER_INFO.get(adapter_type, {})
+        name, description, _ = ADAPTER_DISPLAY[adapter_type]
 
-        console.print(f"[bold]{info.get('name', adapter_type)}[/bold]")
-        console.print(f"[dim]{info.get('description', '')}[/dim]")
+        console.print(f"[bold]{name}[/bold]")
+        console.print(f"[dim]{description}[/dim]")
         console.print()
 
         print_capabilities(adapter)
 
-        strengths = info.get("strengths", [])
+        strengths = ADAPTER_INFO[adapter_type]["strengths"]
         if strengths:
             console.print("[bold]Key Strengths:[/bold]")
             for s in strengths:
@@ -259,7 +285,7 @@ def capabilities(adapter_type: str):
 
     except ImportError:
         console.print(f"[red]Adapter '{adapter_type}' is not installed[/red]")
-        console.print(f"Install with: pip install {ADAPTER_INFO[adapter_type]['package']}")
+        console.print(f"Install with: pip install {ADAPTER_DISPLAY[adapter_type][2]}")
 
 
 @cli.command()
@@ -272,9 +298,9 @@ def run(adapter_type: str, message: str, stream: bool):
 
     try:
         adapter = create_adapter(adapter_type)
-        info = ADAPTER_INFO.get(adapter_type, {})
+        name, _, _ = ADAPTER_DISPLAY[adapter_type]
 
-        console.print(f"[dim]Using {info.get('name', adapter_type)}[/dim]")
+        console.print(f"[dim]Using {name}[/dim]")
         console.print()
 
         if stream:
@@ -308,91 +334,29 @@ def chat(adapter_type: str):
         sys.exit(1)
 
 
-def _run_single_adapter(adapter_name: str, message: str) -> str:
-    """Run a single adapter in isolation. Called via subprocess."""
-    import os
-
-    # Reset argv to prevent langgraph from parsing it
-    sys.argv = [sys.argv[0]]
-
-    try:
-        from openharness import ExecuteRequest
-        adapter = create_adapter(adapter_name)
-
-        response_parts = []
-
-        async def _execute():
-            async for event in adapter.execute_stream(ExecuteRequest(message=message)):
-                if event.type == "text":
-                    response_parts.append(event.content)
-
-        asyncio.run(_execute())
-        return "".join(response_parts)
-    except Exception as e:
-        return f"[ERROR] {e}"
-
-
 @cli.command()
 @click.option("--message", "-m", default="Explain the concept of recursion in one sentence.")
 @click.option("--adapters", "-a", multiple=True, type=click.Choice(["anthropic", "letta", "goose", "deepagent"]))
 def compare(message: str, adapters: tuple[str, ...]):
     """Compare responses across multiple adapters."""
-    import subprocess
-    import json
-
     print_header()
 
     available = get_available_adapters()
 
     if not adapters:
-        adapters = tuple(available)
+        adapters = available
 
     if not adapters:
         console.print("[yellow]No adapters available for comparison[/yellow]")
         sys.exit(1)
 
+    # Reset argv so adapters that parse it (e.g. langgraph) don't see click's arguments
+    sys.argv = [sys.argv[0]]
+
     console.print(f"[dim]Comparing {len(adapters)} adapter(s)...[/dim]")
     console.print()
-    console.print(f"[bold]Prompt:[/bold] {message}")
-    console.print()
-
-    for adapter_name in adapters:
-        info = ADAPTER_INFO.get(adapter_name, {})
-        console.print(f"[bold blue]{info.get('name', adapter_name)}[/bold blue]")
-        console.print("[dim]" + "─" * 40 + "[/dim]")
-
-        # Run each adapter in a subprocess to isolate click context
-        script = f'''
-import sys
-sys.argv = [sys.argv[0]]  # Clear argv before imports
-import asyncio
-from demo.adapters import create_adapter
-from openharness import ExecuteRequest
-
-adapter = create_adapter("{adapter_name}")
-
-async def run():
-    async for event in adapter.execute_stream(ExecuteRequest(message="""{message.replace('"', '\\"')}""")):
-        if event.type == "text":
-            print(event.content, end="", flush=True)
-
-asyncio.run(run())
-'''
-        try:
-            result = subprocess.run(
-                [sys.executable, "-c", script],
-                capture_output=False,
-                text=True,
-                cwd="/Users/jeffschneider/Desktop/OpenHarness/examples/multi-adapter-demo",
-                env={**dict(__import__('os').environ), "PYTHONPATH": "src"},
-                timeout=120,
-            )
-        except subprocess.TimeoutExpired:
-            console.print("[red]Timeout[/red]")
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
 
-        console.print("\n")
+    asyncio.run(compare_adapters(message, [*adapters]))
 
 
 def main():
@@ -18,9 +18,12 @@ Dependencies:
 # Requirements: jinja2
 
 import json
+from dataclasses import dataclass, field, fields
 from typing import Any
 from datetime import datetime
 
+from jinja2 import Environment
+
 
 PRIORITY_ICONS = {
     1: "⭐",
@@ -35,123 +38,192 @@ TYPE_ICONS = {
     "attention": "⚠️",
 }
 
+# (is_followup, is_priority) -> cheat sheet icon / section header prefix
+_ICON_LUT = {
+    (True, True): TYPE_ICONS["followup"],
+    (True, False): TYPE_ICONS["followup"],
+    (False, True): TYPE_ICONS["priority"],
+    (False, False): TYPE_ICONS["new"],
+}
+
+_HEADER_PREFIX_LUT = {
+    (True, True): "🔄 FOLLOW-UP:",
+    (True, False): "🔄 FOLLOW-UP:",
+    (False, True): "⭐ PRIORITY:",
+    (False, False): "🆕 NEW:",
+}
+
+
+@dataclass(slots=True)
+class CompanyInfo:
+    description: str = "Research pending"
+    size: str = "Unknown"
+    industry: str = "Unknown"
+
+
+@dataclass(slots=True)
+class ContactInfo:
+    title: str = ""
+    tenure: str = "Unknown"
+    background: str = "Research pending"
+    mutual_connections: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class History:
+    last_date: str = "Unknown"
+    last_contact: str = "Unknown"
+    summary: str = "No notes"
+    objection: str = "None noted"
+    resonated: str = "Unknown"
+    status: str = "Unknown"
+
+
+@dataclass(slots=True)
+class Approach:
+    angle: str = "Discovery call"
+    opening_line: str = "Standard introduction"
+
+
+@dataclass(slots=True)
+class Prospect:
+    company: str = "Unknown"
+    contact: str = "Unknown"
+    call_time: str = "TBD"
+    priority_rank: int = 99
+    reasoning: str | None = None  # None means "not provided"
+    is_followup: bool = False
+    company_info: CompanyInfo = field(default_factory=CompanyInfo)
+    contact_info: ContactInfo = field(default_factory=ContactInfo)
+    history: History = field(default_factory=History)
+    approach: Approach = field(default_factory=Approach)
+    recent_news: list[dict] = field(default_factory=list)
+    signals_detail: list[str] = field(default_factory=list)
+
+
+def _from_dict(cls: type, data: dict) -> Any:
+    """Build a dataclass from the keys of data it knows about."""
+    return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+def _to_prospect(data: dict) -> Prospect:
+    """Convert a raw prospect dict into a Prospect, once, up front."""
+    prospect = _from_dict(Prospect, data)
+    prospect.company_info = _from_dict(CompanyInfo, data.get("company_info", {}))
+    prospect.contact_info = _from_dict(ContactInfo, data.get("contact_info", {}))
+    prospect.history = _from_dict(History, data.get("history", {}))
+    prospect.approach = _from_dict(Approach, data.get("approach", {}))
+    return prospect
+
+
+# Compiled once at import; rendering a prospect is a single template call.
+_ENV = Environment(
+    autoescape=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+)
+
+_PROSPECT_TEMPLATE = _ENV.from_string("""\
+### {{ header_prefix }} {{ p.company }} ({{ p.call_time }})
+{{ '*%s*'|format(p.reasoning) if p.reasoning }}
+
+**Company Snapshot**
+- **What they do:** {{ p.company_info.description }}
+- **Size:** {{ p.company_info.size }}
+- **Industry:** {{ p.company_info.industry }}
+
+{% if p.recent_news %}
+**Recent Developments**
+{% for item in p.recent_news[:3] %}
+- {{ item.date|default('Recent') }}: {{ item.title|default('News item') }}
+{% endfor %}
+
+{% endif %}
+**Key Person: {{ p.contact }}** ({{ p.contact_info.title }})
+- Tenure: {{ p.contact_info.tenure }}
+- Background: {{ p.contact_info.background }}
+{% if p.contact_info.mutual_connections %}
+- Mutual connections: {{ p.contact_info.mutual_connections|join(', ') }}
+{% endif %}
+
+{% if p.signals_detail %}
+**Pain Point Signals**
+{% for signal in p.signals_detail[:3] %}
+- {{ signal }}
+{% endfor %}
+
+{% endif %}
+{% if is_followup %}
+**Conversation History**
+- **Last contact:** {{ p.history.last_date }} with {{ p.history.last_contact }}
+- **Summary:** {{ p.history.summary }}
+- **Objection raised:** {{ p.history.objection }}
+- **What resonated:** {{ p.history.resonated }}
+- **Status:** {{ p.history.status }}
+
+{% endif %}
+**Recommended Approach**
+- **Angle:** {{ p.approach.angle }}
+- **Opening line:** "{{ p.approach.opening_line }}"
+
+---
+""")
+
+
+_HEADER_TEMPLATE = """\
+# Sales Call Prep Briefings
+
+**Prepared:** {ts}
+**Calls:** {n} scheduled
+
+---
+"""
+
+_POST_CALL_SECTION = """\
+## Post-Call Actions
+
+After each call, update:
+- [ ] CRM notes with conversation summary
+- [ ] Objections encountered
+- [ ] Next steps agreed
+- [ ] Follow-up calendar event
+"""
+
 
-def format_prospect_section(prospect: dict, rank: int) -> str:
+def format_prospect_section(prospect: Prospect, rank: int) -> str:
     """Format a single prospect section."""
-    is_followup = prospect.get("is_followup", False)
-    is_priority = rank <= 2
-
-    # Determine header
-    if is_priority and not is_followup:
-        header_prefix = "⭐ PRIORITY:"
-    elif is_followup:
-        header_prefix = "🔄 FOLLOW-UP:"
-    else:
-        header_prefix = "🆕 NEW:"
-
-    company = prospect.get("company", "Unknown")
-    call_time = prospect.get("call_time", "TBD")
-    reasoning = prospect.get("reasoning", "")
-
-    lines = [
-        f"### {header_prefix} {company} ({call_time})",
-        f"*{reasoning}*" if reasoning else "",
-        "",
-    ]
+    is_followup = bool(prospect.is_followup)
 
-    # Company snapshot
-    company_info = prospect.get("company_info", {})
-    lines.extend([
-        "**Company Snapshot**",
-        f"- **What they do:** {company_info.get('description', 'Research pending')}",
-        f"- **Size:** {company_info.get('size', 'Unknown')}",
-        f"- **Industry:** {company_info.get('industry', 'Unknown')}",
-        "",
-    ])
-
-    # Recent developments
-    news = prospect.get("recent_news", [])
-    if news:
-        lines.append("**Recent Developments**")
-        for item in news[:3]:
-            lines.append(f"- {item.get('date', 'Recent')}: {item.get('title', 'News item')}")
-        lines.append("")
-
-    # Key person
-    contact_info = prospect.get("contact_info", {})
-    contact_name = prospect.get("contact", "Unknown")
-    contact_title = contact_info.get("title", "")
-    lines.extend([
-        f"**Key Person: {contact_name}** ({contact_title})",
-        f"- Tenure: {contact_info.get('tenure', 'Unknown')}",
-        f"- Background: {contact_info.get('background', 'Research pending')}",
-    ])
-
-    mutual = contact_info.get("mutual_connections", [])
-    if mutual:
-        lines.append(f"- Mutual connections: {', '.join(mutual)}")
-    lines.append("")
-
-    # Pain point signals
-    signals = prospect.get("signals_detail", [])
-    if signals:
-        lines.append("**Pain Point Signals**")
-        for signal in signals[:3]:
-            lines.append(f"- {signal}")
-        lines.append("")
-
-    # Follow-up specific section
-    if is_followup:
-        history = prospect.get("history", {})
-        lines.extend([
-            "**Conversation History**",
-            f"- **Last contact:** {history.get('last_date', 'Unknown')} with {history.get('last_contact', 'Unknown')}",
-            f"- **Summary:** {history.get('summary', 'No notes')}",
-            f"- **Objection raised:** {history.get('objection', 'None noted')}",
-            f"- **What resonated:** {history.get('resonated', 'Unknown')}",
-            f"- **Status:** {history.get('status', 'Unknown')}",
-            "",
-        ])
-
-    # Recommended approach
-    approach = prospect.get("approach", {})
-    lines.extend([
-        "**Recommended Approach**",
-        f"- **Angle:** {approach.get('angle', 'Discovery call')}",
-        f"- **Opening line:** \"{approach.get('opening_line', 'Standard introduction')}\"",
-        "",
-        "---",
-        "",
-    ])
-
-    return "\n".join(lines)
-
-
-def format_cheatsheet(prospects: list[dict]) -> str:
-    """Format quick-reference cheat sheet."""
-    lines = [
-        "## Quick Reference Cheat Sheet",
-        "",
-        "| Time | Company | Contact | One-Liner | Priority |",
-        "|------|---------|---------|-----------|----------|",
-    ]
+    return _PROSPECT_TEMPLATE.render(
+        p=prospect,
+        header_prefix=_HEADER_PREFIX_LUT[is_followup, rank <= 2],
+        is_followup=is_followup,
+    )
 
-    for p in prospects:
-        icon = "🔄" if p.get("is_followup") else ("⭐" if p.get("priority_rank", 99) <= 2 else "🆕")
-        one_liner = p.get("reasoning", "Standard call")[:40]
-        lines.append(
-            f"| {p.get('call_time', 'TBD')} | {p.get('company', 'Unknown')} | "
-            f"{p.get('contact', 'Unknown')} | {one_liner} | {icon} |"
-        )
 
-    lines.extend(["", "---", ""])
-    return "\n".join(lines)
+def format_cheatsheet(prospects: list[Prospect]) -> str:
+    """Format quick-reference cheat sheet."""
+    rows = "".join(
+        f"| {p.call_time} | {p.company} | {p.contact} | "
+        f"{('Standard call' if p.reasoning is None else p.reasoning)[:40]} | "
+        f"{_ICON_LUT[bool(p.is_followup), p.priority_rank <= 2]} |\n"
+        for p in prospects
+    )
+    return (
+        "## Quick Reference Cheat Sheet\n"
+        "\n"
+        "| Time | Company | Contact | One-Liner | Priority |\n"
+        "|------|---------|---------|-----------|----------|\n"
+        f"{rows}\n---\n"
+    )
 
 
 def main(
     prospects: list[dict],
     format: str = "markdown",
-    include_cheatsheet: bool = True
+    include_cheatsheet: bool = True,
+    presorted: bool = False,
 ) -> dict[str, Any]:
     """
     Generate formatted briefing document.
@@ -160,52 +232,37 @@ def main(
         prospects: List of researched and ranked prospects
         format: Output format (markdown, pdf, html)
         include_cheatsheet: Whether to include quick reference
+        presorted: Skip sorting when prospects are already ordered by priority_rank
 
     Returns:
         dict with document content and optional cheatsheet
     """
-    # Sort by priority rank
-    sorted_prospects = sorted(prospects, key=lambda x: x.get("priority_rank", 99))
+    now = datetime.now()
+
+    # Convert once, then sort by priority rank
+    sorted_prospects = [_to_prospect(p) for p in prospects]
+    if not presorted:
+        sorted_prospects.sort(key=lambda p: p.priority_rank)
 
     # Build document
-    lines = [
-        "# Sales Call Prep Briefings",
-        "",
-        f"**Prepared:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        f"**Calls:** {len(prospects)} scheduled",
-        "",
-        "---",
-        "",
-    ]
+    lines = [_HEADER_TEMPLATE.format(ts=now.strftime("%Y-%m-%d %H:%M"), n=len(prospects))]
 
     # Add cheatsheet at top if requested
+    cheatsheet = format_cheatsheet(sorted_prospects) if include_cheatsheet else ""
     if include_cheatsheet:
-        lines.append(format_cheatsheet(sorted_prospects))
+        lines.append(cheatsheet)
 
     # Add prospect sections
-    lines.append("## Detailed Briefings")
-    lines.append("")
+    lines.append("## Detailed Briefings\n")
 
     for i, prospect in enumerate(sorted_prospects, 1):
         lines.append(format_prospect_section(prospect, i))
 
     # Post-call section
-    lines.extend([
-        "## Post-Call Actions",
-        "",
-        "After each call, update:",
-        "- [ ] CRM notes with conversation summary",
-        "- [ ] Objections encountered",
-        "- [ ] Next steps agreed",
-        "- [ ] Follow-up calendar event",
-        "",
-    ])
+    lines.append(_POST_CALL_SECTION)
 
     document = "\n".join(lines)
 
-    # Generate cheatsheet separately
-    cheatsheet = format_cheatsheet(sorted_prospects) if include_cheatsheet else ""
-
     # Handle format conversion
     if format == "html":
         try:
@@ -218,7 +275,7 @@ def main(
         document = f"<!-- PDF conversion requires weasyprint -->\n{document}"
 
     # Generate filename
-    date_str = datetime.now().strftime("%Y%m%d")
+    date_str = now.strftime("%Y%m%d")
     filename = f"sales-prep-{date_str}.{'html' if format == 'html' else 'md'}"
 
     return {
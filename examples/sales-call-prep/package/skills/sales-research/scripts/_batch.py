@@ -0,0 +1,46 @@
+"""
+_batch.py - Shared batch runner for the sales-research scripts
+
+Runs a per-item lookup across a thread pool, once per distinct key, and
+hands back one result per input item in input order.
+"""
+
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable
+
+
+def map_unique(
+    fn: Callable[[dict], dict[str, Any]],
+    items: list[dict],
+    key: Callable[[dict], Hashable],
+    max_workers: int = 16,
+) -> list[dict[str, Any]]:
+    """
+    Apply fn to each distinct item concurrently.
+
+    Args:
+        fn: Lookup for one item; should return {"error": ...} rather than raise
+        items: Inputs, possibly with duplicates
+        key: Identity of an item; the first item with each key is looked up
+        max_workers: Upper bound on lookups run at once
+
+    Returns:
+        One result per input item, in input order. Repeats of a key get
+        their own deep copy, so editing one row leaves the others alone.
+    """
+    keys = [key(item) for item in items]
+
+    unique: dict[Hashable, dict] = {}
+    for k, item in zip(keys, items):
+        unique.setdefault(k, item)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = dict(zip(unique, pool.map(fn, unique.values())))
+
+    rows = []
+    seen: set[Hashable] = set()
+    for k in keys:
+        rows.append(copy.deepcopy(results[k]) if k in seen else results[k])
+        seen.add(k)
+    return rows
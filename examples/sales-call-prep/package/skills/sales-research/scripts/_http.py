@@ -0,0 +1,220 @@
+"""
+_http.py - Shared HTTP client for the sales-research scripts
+
+One pooled, retrying requests.Session per process, created on first use.
+When several scripts are loaded into the same long-lived process (e.g. the
+agent runtime), their calls to Clearbit, Crunchbase, Salesforce, etc. reuse
+the same keep-alive connections instead of each paying a fresh handshake.
+
+Calls made through get_json are also rate limited per host with a token
+bucket. A 429 or exhausted X-RateLimit-Remaining holds back every caller
+for that host until its Retry-After / X-RateLimit-Reset has passed.
+
+Dependencies:
+  - requests
+  - ijson (optional, for streaming large responses)
+"""
+
+import atexit
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson
+except ImportError:  # Optional; fall back to decoding the whole body
+    ijson = None
+
+
+# (connect, read) timeout for every upstream call
+REQUEST_TIMEOUT = (3, 10)
+
+# Per-host request budget, before any server feedback
+DEFAULT_RATE = 10.0  # requests per second
+DEFAULT_BURST = 10
+
+# 429s are retried here (not by the adapter) so every thread backs off together
+RATE_LIMIT_RETRIES = 5
+MAX_BACKOFF = 30.0
+
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+_LIMITERS: dict[str, "HostLimiter"] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """Create the pooled, retrying HTTP session shared by all scripts."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": "sales-call-prep/sales-research",
+        "Accept": "application/json",
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+                atexit.register(_SESSION.close)
+    return _SESSION
+
+
+class HostLimiter:
+    """Token bucket for one upstream host, shared by every thread calling it."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request to this host may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for this host for the next `seconds`."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def _limiter_for(url: str) -> HostLimiter:
+    host = urlsplit(url).netloc
+    limiter = _LIMITERS.get(host)
+    if limiter is None:
+        with _LIMITERS_LOCK:
+            limiter = _LIMITERS.setdefault(host, HostLimiter())
+    return limiter
+
+
+def _retry_after(response: requests.Response, default: float) -> float:
+    """Seconds to wait per Retry-After (delta or HTTP date), capped at MAX_BACKOFF."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return default
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return default
+    return min(max(delay, 0.0), MAX_BACKOFF)
+
+
+def _reset_delay(response: requests.Response) -> float:
+    """Seconds until X-RateLimit-Reset (epoch or delta), capped at MAX_BACKOFF."""
+    try:
+        reset = float(response.headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return 1.0
+    if reset > 1e9:  # epoch seconds rather than a delta
+        reset -= time.time()
+    return min(max(reset, 0.0), MAX_BACKOFF)
+
+
+def _get(url: str, session: requests.Session | None, **kwargs) -> requests.Response:
+    """Rate-limited GET with 429 retries; raises for error statuses."""
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    http = session or get_session()
+    limiter = _limiter_for(url)
+
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        limiter.acquire()
+        response = http.get(url, **kwargs)
+
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            limiter.pause(_reset_delay(response))
+        if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+            break
+        response.close()
+        limiter.pause(_retry_after(response, default=min(0.3 * 2 ** attempt, MAX_BACKOFF)))
+
+    response.raise_for_status()
+    return response
+
+
+def get_json(url: str, session: requests.Session | None = None, **kwargs) -> Any:
+    """
+    GET url and decode its JSON body.
+
+    Uses the shared session unless one is passed, and the default
+    REQUEST_TIMEOUT unless the caller sets its own. Waits for the host's
+    rate limiter before each attempt and retries 429s with backoff.
+    Raises a requests.RequestException if the request still fails.
+    """
+    return _get(url, session, **kwargs).json()
+
+
+def iter_json_items(
+    url: str,
+    prefix: str,
+    keys: tuple[str, ...],
+    session: requests.Session | None = None,
+    **kwargs
+) -> Iterator[dict]:
+    """
+    GET url and yield the objects found at prefix, keeping only keys.
+
+    prefix uses ijson's syntax, e.g. "articles.item" for every element of
+    the top-level "articles" array. With ijson installed the body is parsed
+    as it arrives, so only one item is held at a time and the rest of the
+    document is never built; otherwise the whole body is decoded and
+    walked the same way.
+    """
+    with _get(url, session, stream=True, **kwargs) as response:
+        if ijson is not None:
+            response.raw.decode_content = True
+            items = ijson.items(response.raw, prefix, use_float=True)
+        else:
+            items = _walk(response.json(), prefix.split("."))
+        for item in items:
+            yield {key: item.get(key) for key in keys}
+
+
+def _walk(node: Any, path: list[str]) -> Iterator[Any]:
+    """Pure-Python equivalent of ijson.items() for an already decoded body."""
+    if not path:
+        yield node
+        return
+    head, rest = path[0], path[1:]
+    if head == "item":
+        if isinstance(node, list):
+            for child in node:
+                yield from _walk(child, rest)
+    elif isinstance(node, dict) and head in node:
+        yield from _walk(node[head], rest)
@@ -0,0 +1,26 @@
+"""
+_jsonout.py - Shared JSON output for the sales-research scripts
+
+Uses orjson when it is installed and the standard library otherwise. Both
+paths produce the same text: two-space indentation and non-ASCII
+characters written as-is rather than \\u-escaped, since orjson cannot
+escape them.
+
+Dependencies:
+  - orjson (optional, faster serialization)
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional; fall back to stdlib json
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj as pretty-printed JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -21,10 +21,80 @@ Dependencies:
 
 # Requirements: requests, beautifulsoup4
 
-import json
+import copy
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
+from pathlib import Path
+
+import requests
+
+# Sibling helper modules, importable however this script is loaded
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.append(_SCRIPTS_DIR)
+
+import _batch  # noqa: E402
+import _http  # noqa: E402
+import _jsonout  # noqa: E402
+
+
+# Cache lifetimes: company, funding and tech stack data change slowly; news does not
+PROFILE_CACHE_TTL = 24 * 60 * 60
+NEWS_CACHE_TTL = 15 * 60
+
+
+def _ttl_cache(ttl: float, maxsize: int = 10_000):
+    """
+    Memoize a lookup for ttl seconds, keyed on its normalized arguments.
+
+    String arguments are stripped and lowercased so "Acme " and "acme"
+    share an entry, and the session argument is ignored. Every caller gets
+    its own deep copy of the cached value, so mutating a result cannot
+    change what later lookups return.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        cache: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(
+                value.strip().lower() if isinstance(value, str) else value
+                for name, value in bound.arguments.items()
+                if name != "session"
+            )
+
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > now:
+                    cache.move_to_end(key)
+                    return copy.deepcopy(entry[1])
+
+            value = fn(*args, **kwargs)
+
+            with lock:
+                cache[key] = (now + ttl, value)
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return copy.deepcopy(value)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
 
 
 @dataclass
@@ -51,12 +121,22 @@ class CompanyProfile:
     description: str
 
 
-def search_company_info(company_name: str, domain: str = None) -> dict:
+# Field names, resolved once; main() builds a shallow dict from these
+_PROFILE_FIELDS = tuple(f.name for f in fields(CompanyProfile))
+_NEWS_FIELDS = tuple(f.name for f in fields(NewsItem))
+
+
+@_ttl_cache(PROFILE_CACHE_TTL)
+def search_company_info(
+    company_name: str,
+    domain: str = None,
+    session: requests.Session | None = None
+) -> dict:
     """
     Search for basic company information.
     In production, this would call APIs like Clearbit, Crunchbase, etc.
     """
-    # TODO: Implement actual API calls
+    # TODO: Implement actual API calls via _http.get_json(url, session=session)
     # Placeholder return structure
     return {
         "name": company_name,
@@ -69,12 +149,13 @@ def search_company_info(company_name: str, domain: str = None) -> dict:
     }
 
 
-def search_funding_info(company_name: str) -> dict:
+@_ttl_cache(PROFILE_CACHE_TTL)
+def search_funding_info(company_name: str, session: requests.Session | None = None) -> dict:
     """
     Search for funding information.
     In production, would call Crunchbase, PitchBook, etc.
     """
-    # TODO: Implement actual API calls
+    # TODO: Implement actual API calls via _http.get_json(url, session=session)
     return {
         "total_funding": "Unknown",
         "last_round": "Unknown",
@@ -83,21 +164,28 @@ def search_funding_info(company_name: str) -> dict:
     }
 
 
-def search_tech_stack(domain: str) -> list[str]:
+@_ttl_cache(PROFILE_CACHE_TTL)
+def search_tech_stack(domain: str, session: requests.Session | None = None) -> list[str]:
     """
     Detect technology stack.
     In production, would call BuiltWith, Wappalyzer, etc.
     """
-    # TODO: Implement actual API calls
+    # TODO: Implement actual API calls via _http.get_json(url, session=session)
     return []
 
 
-def search_recent_news(company_name: str, days: int = 90) -> list[dict]:
+@_ttl_cache(NEWS_CACHE_TTL)
+def search_recent_news(
+    company_name: str,
+    days: int = 90,
+    session: requests.Session | None = None
+) -> list[dict]:
     """
     Search for recent news about the company.
     In production, would call news APIs.
     """
-    # TODO: Implement actual API calls
+    # TODO: Implement actual API calls. News responses can be large, so stream them:
+    # _http.iter_json_items(url, "articles.item", _NEWS_FIELDS, session=session)
     return []
 
 
@@ -115,18 +203,23 @@ def main(
     Returns:
         dict with company profile including industry, size, funding, tech stack, news
     """
-    # Get basic company info
-    basic_info = search_company_info(company_name, domain)
+    # All lookups for one company share the process-wide connection pool
+    session = _http.get_session()
 
-    # Get funding information
-    funding_info = search_funding_info(company_name)
+    # The sources are independent hosts, so query them concurrently
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        basic_future = pool.submit(search_company_info, company_name, domain, session=session)
+        funding_future = pool.submit(search_funding_info, company_name, session=session)
+        news_future = pool.submit(search_recent_news, company_name, session=session)
 
-    # Detect tech stack
-    company_domain = basic_info.get("domain", domain)
-    tech_stack = search_tech_stack(company_domain) if company_domain else []
+        # Tech stack detection needs the resolved domain, so it starts as
+        # soon as basic info arrives while funding and news are in flight
+        basic_info = basic_future.result()
+        company_domain = basic_info.get("domain", domain)
+        tech_stack = search_tech_stack(company_domain, session=session) if company_domain else []
 
-    # Get recent news
-    news = search_recent_news(company_name)
+        funding_info = funding_future.result()
+        news = news_future.result()
 
     # Compile profile
     profile = CompanyProfile(
@@ -144,13 +237,41 @@ def main(
     )
 
     return {
-        "profile": asdict(profile),
+        "profile": {name: getattr(profile, name) for name in _PROFILE_FIELDS},
         "funding_details": funding_info,
         "enriched_at": datetime.now().isoformat(),
         "sources_checked": ["company_info", "funding", "tech_stack", "news"]
     }
 
 
+def main_batch(prospects: list[dict], max_workers: int = 16) -> list[dict[str, Any]]:
+    """
+    Enrich many companies concurrently.
+
+    Args:
+        prospects: List of {"company_name": str, "domain": str (optional)}
+        max_workers: Upper bound on companies enriched at once
+
+    Returns:
+        One result per input prospect, in input order. Prospects at the
+        same company share a single enrichment; a failed company yields
+        {"error": ...} without aborting the batch.
+    """
+    def enrich(prospect: dict) -> dict[str, Any]:
+        try:
+            return main(prospect["company_name"], prospect.get("domain"))
+        except Exception as e:
+            return {"error": str(e), "company_name": prospect["company_name"]}
+
+    def company_key(prospect: dict) -> tuple[str, str]:
+        return (
+            prospect["company_name"].strip().lower(),
+            (prospect.get("domain") or "").strip().lower(),
+        )
+
+    return _batch.map_unique(enrich, prospects, company_key, max_workers)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -159,4 +280,4 @@ if __name__ == "__main__":
         company_name="DataFlow Systems",
         domain="dataflow.io"
     )
-    print(json.dumps(result, indent=2))
+    print(_jsonout.dumps(result))
@@ -17,13 +17,23 @@ Dependencies:
 
 # Requirements: requests
 
-import json
+import functools
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from pathlib import Path
 
+# Sibling helper modules, importable however this script is loaded
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.append(_SCRIPTS_DIR)
 
-@dataclass
+import _jsonout  # noqa: E402
+
+
+@dataclass(frozen=True)
 class CRMConfig:
     provider: str  # salesforce, hubspot, etc.
     api_url: str
@@ -36,8 +46,9 @@ class CRMSyncError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def get_crm_config() -> CRMConfig:
-    """Load CRM configuration from environment."""
+    """Load CRM configuration from environment, once per process."""
     # In production, would load from environment variables
     # or configuration file
     return CRMConfig(
@@ -51,7 +62,8 @@ def sync_to_salesforce(
     prospect_id: str,
     notes: str,
     next_steps: list[str],
-    config: CRMConfig
+    config: CRMConfig,
+    now: datetime | None = None
 ) -> dict:
     """Sync data to Salesforce."""
     # TODO: Implement actual Salesforce API calls
@@ -61,7 +73,7 @@ def sync_to_salesforce(
         "success": True,
         "record_id": prospect_id,
         "crm_url": f"https://yourorg.salesforce.com/apex/ContactView?id={prospect_id}",
-        "synced_at": datetime.now().isoformat(),
+        "synced_at": (now or datetime.now()).isoformat(),
         "provider": "salesforce"
     }
 
@@ -70,7 +82,8 @@ def sync_to_hubspot(
     prospect_id: str,
     notes: str,
     next_steps: list[str],
-    config: CRMConfig
+    config: CRMConfig,
+    now: datetime | None = None
 ) -> dict:
     """Sync data to HubSpot."""
     # TODO: Implement actual HubSpot API calls
@@ -79,44 +92,42 @@ def sync_to_hubspot(
         "success": True,
         "record_id": prospect_id,
         "crm_url": f"https://app.hubspot.com/contacts/123/contact/{prospect_id}",
-        "synced_at": datetime.now().isoformat(),
+        "synced_at": (now or datetime.now()).isoformat(),
         "provider": "hubspot"
     }
 
 
-def format_notes_for_crm(notes: str, next_steps: list[str], metadata: dict = None) -> str:
+def format_notes_for_crm(
+    notes: str,
+    next_steps: list[str],
+    metadata: dict = None,
+    now: datetime | None = None
+) -> str:
     """Format notes for CRM storage."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    timestamp = (now or datetime.now()).strftime("%Y-%m-%d %H:%M")
 
-    formatted = f"""
---- Research Notes ({timestamp}) ---
-
-{notes}
-
---- Next Steps ---
-"""
-    for i, step in enumerate(next_steps, 1):
-        formatted += f"{i}. {step}\n"
+    parts = [f"--- Research Notes ({timestamp}) ---", "", notes, "", "--- Next Steps ---"]
+    parts.extend(f"{i}. {step}" for i, step in enumerate(next_steps, 1))
 
     if metadata:
-        formatted += "\n--- Metadata ---\n"
-        for key, value in metadata.items():
-            formatted += f"{key}: {value}\n"
+        parts.append("\n--- Metadata ---")
+        parts.extend(f"{key}: {value}" for key, value in metadata.items())
 
-    return formatted.strip()
+    return "\n".join(parts).strip()
 
 
 def create_follow_up_task(
     prospect_id: str,
     task_description: str,
     due_date: str = None,
-    config: CRMConfig = None
+    config: CRMConfig = None,
+    now: datetime | None = None
 ) -> dict:
     """Create a follow-up task in CRM."""
     # TODO: Implement task creation
     return {
         "task_created": True,
-        "task_id": f"task_{prospect_id}_{datetime.now().strftime('%Y%m%d')}",
+        "task_id": f"task_{prospect_id}_{(now or datetime.now()).strftime('%Y%m%d')}",
         "description": task_description,
         "due_date": due_date
     }
@@ -143,24 +154,28 @@ def main(
         dict with success status and CRM URL
     """
     next_steps = next_steps or []
+    # One timestamp for the whole sync, shared by notes, record and tasks
+    now = datetime.now()
 
     try:
+        # The loaded config is cached and shared, so override on a copy
         config = get_crm_config()
         if crm_provider:
-            config.provider = crm_provider
+            config = replace(config, provider=crm_provider)
 
         # Format notes for CRM
         formatted_notes = format_notes_for_crm(
             notes=notes,
             next_steps=next_steps,
-            metadata={"synced_by": "sales-call-prep-agent"}
+            metadata={"synced_by": "sales-call-prep-agent"},
+            now=now
         )
 
         # Sync based on provider
         if config.provider == "salesforce":
-            result = sync_to_salesforce(prospect_id, formatted_notes, next_steps, config)
+            result = sync_to_salesforce(prospect_id, formatted_notes, next_steps, config, now=now)
         elif config.provider == "hubspot":
-            result = sync_to_hubspot(prospect_id, formatted_notes, next_steps, config)
+            result = sync_to_hubspot(prospect_id, formatted_notes, next_steps, config, now=now)
         else:
             return {
                 "success": False,
@@ -171,13 +186,17 @@ def main(
         # Create tasks if requested
         tasks_created = []
         if create_tasks and next_steps:
-            for step in next_steps:
-                task_result = create_follow_up_task(
-                    prospect_id=prospect_id,
-                    task_description=step,
-                    config=config
-                )
-                tasks_created.append(task_result)
+            # Each task is an independent CRM call, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(next_steps))) as pool:
+                tasks_created = list(pool.map(
+                    lambda step: create_follow_up_task(
+                        prospect_id=prospect_id,
+                        task_description=step,
+                        config=config,
+                        now=now
+                    ),
+                    next_steps
+                ))
 
         result["tasks_created"] = tasks_created
         result["notes_length"] = len(formatted_notes)
@@ -217,4 +236,4 @@ Angle: Position as force multiplier for scaling ops team
         ],
         create_tasks=True
     )
-    print(json.dumps(result, indent=2))
+    print(_jsonout.dumps(result))
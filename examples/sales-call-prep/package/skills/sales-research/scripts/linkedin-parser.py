@@ -21,10 +21,19 @@ Dependencies:
 
 # Requirements: requests
 
-import json
+import sys
 from typing import Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
+from pathlib import Path
+
+# Sibling helper modules, importable however this script is loaded
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.append(_SCRIPTS_DIR)
+
+import _batch  # noqa: E402
+import _jsonout  # noqa: E402
 
 
 @dataclass
@@ -58,6 +67,10 @@ class ContactProfile:
     headline: str
 
 
+# Field names, resolved once; main() builds a shallow dict from these
+_CONTACT_FIELDS = tuple(f.name for f in fields(ContactProfile))
+
+
 def search_linkedin_profile(name: str = None, company: str = None, profile_url: str = None) -> dict:
     """
     Search for LinkedIn profile information.
@@ -167,7 +180,7 @@ def main(
 
     return {
         "found": True,
-        "contact": asdict(contact),
+        "contact": {name: getattr(contact, name) for name in _CONTACT_FIELDS},
         "research_date": datetime.now().isoformat(),
         "data_completeness": calculate_completeness(contact)
     }
@@ -191,6 +204,38 @@ def calculate_completeness(contact: ContactProfile) -> dict:
     }
 
 
+def main_batch(contacts: list[dict], max_workers: int = 16) -> list[dict[str, Any]]:
+    """
+    Structure many LinkedIn profiles concurrently.
+
+    Args:
+        contacts: List of {"name", "company"} and/or {"profile_url"} dicts
+        max_workers: Upper bound on profiles fetched at once
+
+    Returns:
+        One result per input contact, in input order. Duplicate contacts
+        share a single lookup; a failed lookup yields {"error": ...}
+        without aborting the batch.
+    """
+    def parse(contact: dict) -> dict[str, Any]:
+        try:
+            return main(
+                name=contact.get("name"),
+                company=contact.get("company"),
+                profile_url=contact.get("profile_url")
+            )
+        except Exception as e:
+            return {"error": str(e)}
+
+    def contact_key(contact: dict) -> tuple[str, ...]:
+        return tuple(
+            (contact.get(field) or "").strip().lower()
+            for field in ("name", "company", "profile_url")
+        )
+
+    return _batch.map_unique(parse, contacts, contact_key, max_workers)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -199,4 +244,4 @@ if __name__ == "__main__":
         name="Sarah Chen",
         company="DataFlow Systems"
     )
-    print(json.dumps(result, indent=2))
+    print(_jsonout.dumps(result))
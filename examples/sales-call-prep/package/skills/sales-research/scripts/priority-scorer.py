@@ -13,9 +13,18 @@ Dependencies:
   - (none - pure Python)
 """
 
-import json
+import heapq
+import sys
 from typing import Any
 from dataclasses import dataclass
+from pathlib import Path
+
+# Sibling helper modules, importable however this script is loaded
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.append(_SCRIPTS_DIR)
+
+import _jsonout  # noqa: E402
 
 
 # Default scoring weights
@@ -26,6 +35,9 @@ DEFAULT_WEIGHTS = {
     "signals": 0.25
 }
 
+_WEIGHT_KEYS = ("deal_size", "timing", "warmth", "signals")
+_DEFAULT_W = tuple(DEFAULT_WEIGHTS[k] for k in _WEIGHT_KEYS)
+
 # Signal score mapping
 SIGNAL_SCORES = {
     # High-intent signals
@@ -51,6 +63,19 @@ SIGNAL_SCORES = {
     "competitor_selected": -7,
 }
 
+# Timing signal -> (score bump, reason)
+_TIMING_SIGNALS = {
+    "budget_cycle_q4": (3, "Q4 budget planning"),
+    "contract_expiring": (4, "Contract expiring soon"),
+    "active_evaluation": (5, "Actively evaluating"),
+    "just_funded": (3, "Recently funded"),
+}
+
+# Reason labels for the signals that score above zero
+_SIGNAL_LABELS = {
+    key: key.replace("_", " ") for key, value in SIGNAL_SCORES.items() if value > 0
+}
+
 
 @dataclass
 class ScoredProspect:
@@ -83,26 +108,26 @@ def score_deal_size(prospect: dict) -> tuple[float, str]:
         return 3.0, "Small business"
 
 
+def _timing_score(prospect: dict) -> float:
+    """Timing score without the reason string."""
+    score = 5.0  # Base score
+    for signal in prospect.get("timing_signals", []):
+        hit = _TIMING_SIGNALS.get(signal)
+        if hit:
+            score += hit[0]
+    return min(score, 10.0)
+
+
 def score_timing(prospect: dict) -> tuple[float, str]:
     """Score based on timing signals."""
-    timing_signals = prospect.get("timing_signals", [])
-
     score = 5.0  # Base score
     reasons = []
 
-    for signal in timing_signals:
-        if signal == "budget_cycle_q4":
-            score += 3
-            reasons.append("Q4 budget planning")
-        elif signal == "contract_expiring":
-            score += 4
-            reasons.append("Contract expiring soon")
-        elif signal == "active_evaluation":
-            score += 5
-            reasons.append("Actively evaluating")
-        elif signal == "just_funded":
-            score += 3
-            reasons.append("Recently funded")
+    for signal in prospect.get("timing_signals", []):
+        hit = _TIMING_SIGNALS.get(signal)
+        if hit:
+            score += hit[0]
+            reasons.append(hit[1])
 
     return min(score, 10.0), "; ".join(reasons) if reasons else "Standard timing"
 
@@ -132,18 +157,26 @@ def score_warmth(prospect: dict) -> tuple[float, str]:
     return 4.0, "Cold outreach"
 
 
+def _signal_score(prospect: dict) -> float:
+    """Signal score without the reason string."""
+    total_score = 0
+    for signal in prospect.get("signals", []):
+        total_score += SIGNAL_SCORES.get(signal, 0)
+
+    # Normalize to 0-10 scale
+    return min(max(total_score / 2, 0), 10)
+
+
 def score_signals(prospect: dict) -> tuple[float, str]:
     """Score based on buying signals detected."""
-    signals = prospect.get("signals", [])
-
     total_score = 0
     signal_reasons = []
 
-    for signal in signals:
+    for signal in prospect.get("signals", []):
         signal_score = SIGNAL_SCORES.get(signal, 0)
         total_score += signal_score
         if signal_score > 0:
-            signal_reasons.append(signal.replace("_", " "))
+            signal_reasons.append(_SIGNAL_LABELS[signal])
 
     # Normalize to 0-10 scale
     normalized = min(max(total_score / 2, 0), 10)
@@ -152,6 +185,24 @@ def score_signals(prospect: dict) -> tuple[float, str]:
     return normalized, reason
 
 
+def _weights_tuple(weights: dict | None) -> tuple[float, float, float, float]:
+    """Scoring weights in _WEIGHT_KEYS order; the default tuple is prebuilt."""
+    if not weights or weights is DEFAULT_WEIGHTS:
+        return _DEFAULT_W
+    return tuple(weights[k] for k in _WEIGHT_KEYS)
+
+
+def _raw_score(prospect: dict, weights: tuple[float, float, float, float]) -> float:
+    """Weighted total for a prospect, without building any strings."""
+    w_deal, w_timing, w_warmth, w_signals = weights
+    return (
+        score_deal_size(prospect)[0] * w_deal +
+        _timing_score(prospect) * w_timing +
+        score_warmth(prospect)[0] * w_warmth +
+        _signal_score(prospect) * w_signals
+    )
+
+
 def calculate_priority_score(
     prospect: dict,
     weights: dict = None
@@ -202,9 +253,19 @@ def calculate_priority_score(
     )
 
 
-def main(
+def score_batch(
     prospects: list[dict],
     weights: dict = None
+) -> list[ScoredProspect]:
+    """Score a list of prospects, returning them in input order."""
+    weights = weights or DEFAULT_WEIGHTS
+    return [calculate_priority_score(p, weights) for p in prospects]
+
+
+def main(
+    prospects: list[dict],
+    weights: dict = None,
+    top_k: int | None = None
 ) -> dict[str, Any]:
     """
     Calculate and rank prospect priorities.
@@ -212,17 +273,26 @@ def main(
     Args:
         prospects: List of prospect objects with signals
         weights: Optional custom weights for scoring components
+        top_k: Only return the K highest-ranked prospects (default: all)
 
     Returns:
         dict with ranked prospects and scoring details
     """
     weights = weights or DEFAULT_WEIGHTS
 
-    # Score all prospects
-    scored = [calculate_priority_score(p, weights) for p in prospects]
+    if top_k is not None and top_k < len(prospects):
+        # Rank on the numeric scores alone and build reasoning only for the
+        # top K; nlargest keeps sorted()'s order for equal (rounded) scores
+        weights_t = _weights_tuple(weights)
+        rounded = [round(_raw_score(p, weights_t), 2) for p in prospects]
+        order = heapq.nlargest(top_k, range(len(prospects)), key=rounded.__getitem__)
+        scored = [calculate_priority_score(prospects[i], weights) for i in order]
+    else:
+        # Score all prospects
+        scored = [calculate_priority_score(p, weights) for p in prospects]
 
-    # Sort by raw score descending
-    scored.sort(key=lambda x: x.raw_score, reverse=True)
+        # Sort by raw score descending
+        scored.sort(key=lambda x: x.raw_score, reverse=True)
 
     # Assign ranks
     for i, prospect in enumerate(scored, 1):
@@ -284,4 +354,4 @@ if __name__ == "__main__":
     ]
 
     result = main(prospects=example_prospects)
-    print(json.dumps(result, indent=2))
+    print(_jsonout.dumps(result))
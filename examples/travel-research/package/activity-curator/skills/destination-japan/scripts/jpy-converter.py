@@ -5,7 +5,12 @@ JPY currency converter for travel budgeting.
 
 import json
 import sys
-from typing import Dict
+from typing import Any, Dict, List
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator; fall back to stdlib json
+    orjson = None
 
 # Approximate rates - in production, would fetch live rates
 DEFAULT_RATES = {
@@ -19,15 +24,13 @@ DEFAULT_RATES = {
 
 def convert_to_jpy(amount: float, from_currency: str, rates: Dict[str, float] = None) -> Dict:
     """Convert foreign currency to JPY."""
-    rates = rates or DEFAULT_RATES
-
     if from_currency == "JPY":
         return {"jpy": amount, "rate": 1.0, "from": from_currency}
 
-    if from_currency not in rates:
+    rate = (rates or DEFAULT_RATES).get(from_currency)
+    if rate is None:
         return {"error": f"Unknown currency: {from_currency}"}
 
-    rate = rates[from_currency]
     jpy = amount * rate
 
     return {
@@ -40,15 +43,13 @@ def convert_to_jpy(amount: float, from_currency: str, rates: Dict[str, float] =
 
 def convert_from_jpy(jpy: float, to_currency: str, rates: Dict[str, float] = None) -> Dict:
     """Convert JPY to foreign currency."""
-    rates = rates or DEFAULT_RATES
-
     if to_currency == "JPY":
         return {"amount": jpy, "rate": 1.0, "to": to_currency}
 
-    if to_currency not in rates:
+    rate = (rates or DEFAULT_RATES).get(to_currency)
+    if rate is None:
         return {"error": f"Unknown currency: {to_currency}"}
 
-    rate = rates[to_currency]
     amount = jpy / rate
 
     return {
@@ -59,24 +60,64 @@ def convert_from_jpy(jpy: float, to_currency: str, rates: Dict[str, float] = Non
     }
 
 
+def convert_to_jpy_batch(
+    amounts: List[float],
+    currencies: List[str],
+    rates: Dict[str, float] = None
+) -> List[Dict]:
+    """Convert many amounts to JPY, resolving each distinct currency once."""
+    rates = rates or DEFAULT_RATES
+    resolved = {currency: rates.get(currency) for currency in set(currencies)}
+
+    results = []
+    for amount, currency in zip(amounts, currencies):
+        rate = resolved[currency]
+        if currency == "JPY":
+            results.append({"jpy": amount, "rate": 1.0, "from": currency})
+        elif rate is None:
+            results.append({"error": f"Unknown currency: {currency}"})
+        else:
+            results.append({
+                "jpy": round(amount * rate),
+                "rate": rate,
+                "from": currency,
+                "original": amount
+            })
+    return results
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize obj as pretty-printed JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: jpy-converter.py <json_input>")
         print('To JPY: {"amount": 100, "from": "USD"}')
         print('From JPY: {"jpy": 15000, "to": "USD"}')
+        print('Batch to JPY: {"items": [{"amount": 100, "from": "USD"}, ...]}')
         sys.exit(1)
 
     try:
-        data = json.loads(sys.argv[1])
-
-        if "from" in data:
+        data = orjson.loads(sys.argv[1]) if orjson is not None else json.loads(sys.argv[1])
+
+        if "items" in data:
+            items = data["items"]
+            result = convert_to_jpy_batch(
+                [item["amount"] for item in items],
+                [item["from"] for item in items]
+            )
+        elif "from" in data:
             result = convert_to_jpy(data["amount"], data["from"])
         elif "to" in data:
             result = convert_from_jpy(data["jpy"], data["to"])
         else:
             result = {"error": "Specify 'from' or 'to' currency"}
 
-        print(json.dumps(result, indent=2))
+        print(_dumps(result))
     except Exception as e:
         print(json.dumps({"error": str(e)}))
         sys.exit(1)
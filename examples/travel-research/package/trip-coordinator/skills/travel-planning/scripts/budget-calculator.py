@@ -6,11 +6,17 @@ Tracks spending across categories and validates against budget constraints.
 
 import json
 import sys
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, fields
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; fall back to stdlib json
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class BudgetItem:
     category: str
     description: str
@@ -18,7 +24,7 @@ class BudgetItem:
     currency: str = "USD"
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetSummary:
     total_budget: float
     total_spent: float
@@ -28,6 +34,10 @@ class BudgetSummary:
     warnings: List[str]
 
 
+# Field names, resolved once; main() builds a shallow dict from these
+_SUMMARY_FIELDS = tuple(f.name for f in fields(BudgetSummary))
+
+
 def calculate_budget(
     budget: float,
     items: List[Dict],
@@ -44,14 +54,13 @@ def calculate_budget(
     Returns:
         BudgetSummary with totals and warnings
     """
-    by_category: Dict[str, float] = {}
+    totals: defaultdict[str, float] = defaultdict(int)
     warnings: List[str] = []
 
     for item in items:
-        cat = item["category"]
-        amount = item["amount"]
-        by_category[cat] = by_category.get(cat, 0) + amount
+        totals[item["category"]] += item["amount"]
 
+    by_category = dict(totals)
     total_spent = sum(by_category.values())
     remaining = budget - total_spent
     over_budget = remaining < 0
@@ -61,9 +70,9 @@ def calculate_budget(
 
     if category_limits:
         for cat, limit in category_limits.items():
-            if cat in by_category and by_category[cat] > limit:
-                over = by_category[cat] - limit
-                warnings.append(f"{cat} over limit by ${over:.2f}")
+            spent = by_category.get(cat)
+            if spent is not None and spent > limit:
+                warnings.append(f"{cat} over limit by ${spent - limit:.2f}")
 
     if remaining > 0 and remaining < budget * 0.1:
         warnings.append("Less than 10% budget remaining")
@@ -78,6 +87,13 @@ def calculate_budget(
     )
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize obj as pretty-printed JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: budget-calculator.py <json_input>")
@@ -85,13 +101,13 @@ def main():
         sys.exit(1)
 
     try:
-        data = json.loads(sys.argv[1])
+        data = orjson.loads(sys.argv[1]) if orjson is not None else json.loads(sys.argv[1])
         result = calculate_budget(
             budget=data["budget"],
             items=data["items"],
             category_limits=data.get("category_limits")
         )
-        print(json.dumps(asdict(result), indent=2))
+        print(_dumps({name: getattr(result, name) for name in _SUMMARY_FIELDS}))
     except Exception as e:
         print(json.dumps({"error": str(e)}))
         sys.exit(1)
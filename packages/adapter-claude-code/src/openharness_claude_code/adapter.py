@@ -4,19 +4,18 @@ Claude Code adapter for Open Harness.
 Implements the HarnessAdapter interface for Claude Agent SDK,
 providing access to Claude Code's full agent capabilities including
 built-in tools, MCP integration, skills, hooks, and subagents.
+
+The Claude Agent SDK is only imported once a prompt is executed, so
+listing tools or reading the capability manifest stays cheap.
 """
 
-from typing import Any, AsyncIterator
+import asyncio
+import contextlib
+import io
+import weakref
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, AsyncIterator
 
-from claude_agent_sdk import (
-    AssistantMessage,
-    ResultMessage,
-    SystemMessage,
-    TextBlock,
-    ThinkingBlock,
-    ToolResultBlock,
-    ToolUseBlock,
-)
 from openharness.adapter import (
     AdapterCapabilities,
     AdapterExecutionResult,
@@ -38,12 +37,257 @@ from openharness.types.events import (
     ThinkingEvent,
     ToolCallEndEvent,
     ToolCallStartEvent,
+    ToolEventBatchEvent,
     ToolResultEvent,
 )
 
 from .executor import ClaudeCodeExecutor
 from .types import ClaudeCodeConfig
 
+# Static tool and capability descriptions, built once at import rather than
+# on every list_tools() / get_capability_manifest() call.
+_BUILTIN_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        id="Read",
+        name="Read",
+        description="Read file contents from the filesystem",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Absolute path to the file to read",
+                },
+            },
+            "required": ["file_path"],
+        },
+    ),
+    Tool(
+        id="Write",
+        name="Write",
+        description="Write content to a file",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Absolute path to the file to write",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Content to write to the file",
+                },
+            },
+            "required": ["file_path", "content"],
+        },
+    ),
+    Tool(
+        id="Edit",
+        name="Edit",
+        description="Edit a file by replacing text",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Absolute path to the file to edit",
+                },
+                "old_string": {
+                    "type": "string",
+                    "description": "Text to replace",
+                },
+                "new_string": {
+                    "type": "string",
+                    "description": "Replacement text",
+                },
+            },
+            "required": ["file_path", "old_string", "new_string"],
+        },
+    ),
+    Tool(
+        id="Bash",
+        name="Bash",
+        description="Execute a bash command",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "command": {
+                    "type": "string",
+                    "description": "The command to execute",
+                },
+            },
+            "required": ["command"],
+        },
+    ),
+    Tool(
+        id="Glob",
+        name="Glob",
+        description="Find files matching a glob pattern",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "Glob pattern to match",
+                },
+            },
+            "required": ["pattern"],
+        },
+    ),
+    Tool(
+        id="Grep",
+        name="Grep",
+        description="Search file contents with regex",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "Regex pattern to search for",
+                },
+            },
+            "required": ["pattern"],
+        },
+    ),
+    Tool(
+        id="WebSearch",
+        name="WebSearch",
+        description="Search the web for information",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query",
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        id="WebFetch",
+        name="WebFetch",
+        description="Fetch and process content from a URL",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL to fetch",
+                },
+                "prompt": {
+                    "type": "string",
+                    "description": "Prompt for processing the content",
+                },
+            },
+            "required": ["url", "prompt"],
+        },
+    ),
+    Tool(
+        id="Task",
+        name="Task",
+        description="Launch a sub-agent for complex tasks",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "description": {
+                    "type": "string",
+                    "description": "Short description of the task",
+                },
+                "prompt": {
+                    "type": "string",
+                    "description": "Detailed task prompt",
+                },
+                "subagent_type": {
+                    "type": "string",
+                    "description": "Type of sub-agent to use",
+                },
+            },
+            "required": ["description", "prompt", "subagent_type"],
+        },
+    ),
+    Tool(
+        id="TodoWrite",
+        name="TodoWrite",
+        description="Manage task list for tracking progress",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "todos": {
+                    "type": "array",
+                    "description": "List of todo items",
+                },
+            },
+            "required": ["todos"],
+        },
+    ),
+    Tool(
+        id="NotebookEdit",
+        name="NotebookEdit",
+        description="Edit Jupyter notebook cells",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "notebook_path": {
+                    "type": "string",
+                    "description": "Absolute path to the notebook",
+                },
+                "new_source": {
+                    "type": "string",
+                    "description": "New cell source content",
+                },
+            },
+            "required": ["notebook_path", "new_source"],
+        },
+    ),
+    Tool(
+        id="AskUserQuestion",
+        name="AskUserQuestion",
+        description="Ask the user a question during execution",
+        source="builtin",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "questions": {
+                    "type": "array",
+                    "description": "List of questions to ask",
+                },
+            },
+            "required": ["questions"],
+        },
+    ),
+)
+
+_CAPABILITIES: tuple[CapabilityInfo, ...] = (
+    CapabilityInfo(id="execution.run", supported=True),
+    CapabilityInfo(id="execution.stream", supported=True),
+    CapabilityInfo(
+        id="tools.builtin",
+        supported=True,
+        notes="Read, Write, Edit, Bash, Glob, Grep, WebSearch, WebFetch, Task, TodoWrite",
+    ),
+    CapabilityInfo(id="mcp.servers", supported=True),
+    CapabilityInfo(id="skills.system", supported=True),
+    CapabilityInfo(id="hooks.events", supported=True),
+    CapabilityInfo(id="subagents.task", supported=True),
+    CapabilityInfo(
+        id="models.switch",
+        supported=True,
+        notes="sonnet, opus, haiku",
+    ),
+)
+
 
 class ClaudeCodeAdapter(HarnessAdapter):
     """
@@ -89,6 +333,8 @@ class ClaudeCodeAdapter(HarnessAdapter):
         """
         self._config = config or ClaudeCodeConfig()
         self._executor = ClaudeCodeExecutor(self._config)
+        # Cancellation tokens of the executions started and not yet collected
+        self._tokens: weakref.WeakSet[asyncio.Event] = weakref.WeakSet()
 
     @property
     def id(self) -> str:
@@ -130,24 +376,7 @@ class ClaudeCodeAdapter(HarnessAdapter):
         return CapabilityManifest(
             harness_id=self.id,
             version=self.version,
-            capabilities=[
-                CapabilityInfo(id="execution.run", supported=True),
-                CapabilityInfo(id="execution.stream", supported=True),
-                CapabilityInfo(
-                    id="tools.builtin",
-                    supported=True,
-                    notes="Read, Write, Edit, Bash, Glob, Grep, WebSearch, WebFetch, Task, TodoWrite",
-                ),
-                CapabilityInfo(id="mcp.servers", supported=True),
-                CapabilityInfo(id="skills.system", supported=True),
-                CapabilityInfo(id="hooks.events", supported=True),
-                CapabilityInfo(id="subagents.task", supported=True),
-                CapabilityInfo(
-                    id="models.switch",
-                    supported=True,
-                    notes="sonnet, opus, haiku",
-                ),
-            ],
+            capabilities=list(_CAPABILITIES),
         )
 
     async def execute(
@@ -165,13 +394,14 @@ class ClaudeCodeAdapter(HarnessAdapter):
         Returns:
             Complete execution result
         """
-        output_parts: list[str] = []
+        output = io.StringIO()
         tool_calls: list[dict[str, Any]] = []
         usage: UsageStats | None = None
 
-        async for event in self.execute_stream(request, **options):
+        # Consume the unbatched stream; batching only helps live consumers
+        async for event in self._stream_events(request, self._new_token(), **options):
             if event.type == "text":
-                output_parts.append(event.content)
+                output.write(event.content)
             elif event.type == "tool_call_start":
                 tool_calls.append({
                     "id": event.id,
@@ -181,10 +411,10 @@ class ClaudeCodeAdapter(HarnessAdapter):
             elif event.type == "done":
                 usage = event.usage
             elif event.type == "error":
-                output_parts.append(f"[Error: {event.message}]")
+                output.write(f"[Error: {event.message}]")
 
         return AdapterExecutionResult(
-            output="".join(output_parts),
+            output=output.getvalue(),
             tool_calls=tool_calls,
             usage=usage,
             metadata={
@@ -193,7 +423,7 @@ class ClaudeCodeAdapter(HarnessAdapter):
             },
         )
 
-    async def execute_stream(
+    def execute_stream(
         self,
         request: ExecuteRequest,
         **options: Any,
@@ -201,76 +431,141 @@ class ClaudeCodeAdapter(HarnessAdapter):
         """
         Execute a prompt with streaming.
 
+        The execution is registered for cancel() as soon as this is called,
+        before the returned iterator is first awaited.
+
         Args:
             request: Execution request
             **options: Additional options
 
-        Yields:
-            Execution events as they occur
+        Returns:
+            Execution events as they occur. If config.flush_interval_ms is set,
+            runs of tool events arrive as ToolEventBatchEvent instead.
         """
-        current_tool_id: str | None = None
+        cancelled = self._new_token()
+        events = self._stream_events(request, cancelled, **options)
+        if self._config.flush_interval_ms:
+            events = _batch_tool_events(
+                events, self._config.flush_interval_ms / 1000, cancelled
+            )
+        return events
+
+    def _new_token(self) -> asyncio.Event:
+        """Create the cancellation token for one execution and register it."""
+        token = asyncio.Event()
+        self._tokens.add(token)
+        return token
+
+    async def _stream_events(
+        self,
+        request: ExecuteRequest,
+        cancelled: asyncio.Event,
+        **options: Any,
+    ) -> AsyncGenerator[ExecutionEvent, None]:
+        """Translate SDK messages into execution events, one per block."""
+        from claude_agent_sdk import (
+            AssistantMessage,
+            ResultMessage,
+            SystemMessage,
+            TextBlock,
+            ThinkingBlock,
+            ToolResultBlock,
+            ToolUseBlock,
+            UserMessage,
+        )
+
+        # Started tools awaiting their result, in start order
+        open_tools: dict[str, None] = {}
+        done = False
 
         try:
-            async for message in self._executor.execute(
+            sdk_messages = self._executor.execute(
                 prompt=request.message,
                 config=self._config,
-            ):
-                # Handle AssistantMessage with content blocks
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            yield TextEvent(content=block.text)
-
-                        elif isinstance(block, ThinkingBlock):
-                            yield ThinkingEvent(thinking=block.thinking)
-
-                        elif isinstance(block, ToolUseBlock):
-                            # End previous tool if any
-                            if current_tool_id:
-                                yield ToolCallEndEvent(id=current_tool_id)
-
-                            current_tool_id = block.id
-                            yield ToolCallStartEvent(
-                                id=block.id,
-                                name=block.name,
-                                input=block.input,
+            )
+            prefetched = _prefetch(sdk_messages, _PREFETCH_MESSAGES, cancelled)
+            async with aclosing(prefetched) as messages:
+                async for message in messages:
+                    # Stop before building events nobody will consume
+                    if cancelled.is_set():
+                        break
+
+                    # Handle AssistantMessage with content blocks
+                    if isinstance(message, AssistantMessage):
+                        content = message.content
+                        if not content:
+                            continue
+
+                        for block in content:
+                            if cancelled.is_set():
+                                break
+
+                            # SDK content blocks are concrete dataclasses, so an
+                            # exact type check is enough (and cheaper than isinstance)
+                            if type(block) is TextBlock:
+                                yield TextEvent(content=block.text)
+
+                            elif type(block) is ThinkingBlock:
+                                yield ThinkingEvent(thinking=block.thinking)
+
+                            elif type(block) is ToolUseBlock:
+                                open_tools[block.id] = None
+                                yield ToolCallStartEvent(
+                                    id=block.id,
+                                    name=block.name,
+                                    input=block.input,
+                                )
+
+                            elif type(block) is ToolResultBlock:
+                                open_tools.pop(block.tool_use_id, None)
+                                for event in _tool_result_events(block):
+                                    yield event
+
+                    # Handle UserMessage, which carries results of our tool calls
+                    elif isinstance(message, UserMessage):
+                        user_content = message.content
+                        if isinstance(user_content, str):
+                            continue
+
+                        for block in user_content:
+                            if cancelled.is_set():
+                                break
+
+                            if type(block) is ToolResultBlock:
+                                open_tools.pop(block.tool_use_id, None)
+                                for event in _tool_result_events(block):
+                                    yield event
+
+                    # Handle SystemMessage (initialization, status)
+                    elif isinstance(message, SystemMessage):
+                        # System messages are internal, skip or log
+                        pass
+
+                    # Handle ResultMessage (completion with usage)
+                    elif isinstance(message, ResultMessage):
+                        # End tools that never reported a result
+                        for tool_id in open_tools:
+                            yield ToolCallEndEvent(id=tool_id)
+                        open_tools.clear()
+
+                        # Extract usage stats
+                        usage = None
+                        raw_usage = message.usage
+                        if raw_usage:
+                            input_tokens = raw_usage.get("input_tokens", 0)
+                            output_tokens = raw_usage.get("output_tokens", 0)
+                            usage = UsageStats(
+                                input_tokens=input_tokens,
+                                output_tokens=output_tokens,
+                                total_tokens=input_tokens + output_tokens,
+                                duration_ms=message.duration_ms,
                             )
 
-                        elif isinstance(block, ToolResultBlock):
-                            yield ToolResultEvent(
-                                id=block.tool_use_id,
-                                success=not block.is_error,
-                                output=block.content,
-                                error=None if not block.is_error else str(block.content),
-                            )
-                            yield ToolCallEndEvent(id=block.tool_use_id)
-                            if current_tool_id == block.tool_use_id:
-                                current_tool_id = None
-
-                # Handle SystemMessage (initialization, status)
-                elif isinstance(message, SystemMessage):
-                    # System messages are internal, skip or log
-                    pass
-
-                # Handle ResultMessage (completion with usage)
-                elif isinstance(message, ResultMessage):
-                    if current_tool_id:
-                        yield ToolCallEndEvent(id=current_tool_id)
-                        current_tool_id = None
-
-                    # Extract usage stats
-                    usage = None
-                    if message.usage:
-                        input_tokens = message.usage.get("input_tokens", 0)
-                        output_tokens = message.usage.get("output_tokens", 0)
-                        usage = UsageStats(
-                            input_tokens=input_tokens,
-                            output_tokens=output_tokens,
-                            total_tokens=input_tokens + output_tokens,
-                            duration_ms=message.duration_ms,
-                        )
-
-                    yield DoneEvent(usage=usage)
+                        done = True
+                        yield DoneEvent(usage=usage)
+
+            if cancelled.is_set() and not done:
+                yield DoneEvent(usage=None)
 
         except RuntimeError as e:
             yield ErrorEvent(
@@ -281,10 +576,22 @@ class ClaudeCodeAdapter(HarnessAdapter):
         except Exception as e:
             yield ErrorEvent(
                 code="unknown_error",
-                message=f"{type(e).__name__}: {e}",
+                message=type(e).__name__ + ": " + str(e),
                 recoverable=False,
             )
 
+    def cancel(self) -> None:
+        """
+        Cancel every execution started on this adapter that is still running.
+
+        Each stream stops at once, even while waiting on the SDK, drops
+        anything still pending (including buffered tool events), and ends
+        with a single DoneEvent without usage. Executions started after
+        this call are not affected.
+        """
+        for token in list(self._tokens):
+            token.set()
+
     async def list_tools(self) -> list[Tool]:
         """
         List available built-in tools.
@@ -293,230 +600,10 @@ class ClaudeCodeAdapter(HarnessAdapter):
         can be added via MCP servers.
 
         Returns:
-            List of built-in tool definitions.
+            A new list of the built-in tool definitions. The Tool objects
+            are shared between calls and should be treated as read-only.
         """
-        return [
-            Tool(
-                id="Read",
-                name="Read",
-                description="Read file contents from the filesystem",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Absolute path to the file to read",
-                        },
-                    },
-                    "required": ["file_path"],
-                },
-            ),
-            Tool(
-                id="Write",
-                name="Write",
-                description="Write content to a file",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Absolute path to the file to write",
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Content to write to the file",
-                        },
-                    },
-                    "required": ["file_path", "content"],
-                },
-            ),
-            Tool(
-                id="Edit",
-                name="Edit",
-                description="Edit a file by replacing text",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Absolute path to the file to edit",
-                        },
-                        "old_string": {
-                            "type": "string",
-                            "description": "Text to replace",
-                        },
-                        "new_string": {
-                            "type": "string",
-                            "description": "Replacement text",
-                        },
-                    },
-                    "required": ["file_path", "old_string", "new_string"],
-                },
-            ),
-            Tool(
-                id="Bash",
-                name="Bash",
-                description="Execute a bash command",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "command": {
-                            "type": "string",
-                            "description": "The command to execute",
-                        },
-                    },
-                    "required": ["command"],
-                },
-            ),
-            Tool(
-                id="Glob",
-                name="Glob",
-                description="Find files matching a glob pattern",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "pattern": {
-                            "type": "string",
-                            "description": "Glob pattern to match",
-                        },
-                    },
-                    "required": ["pattern"],
-                },
-            ),
-            Tool(
-                id="Grep",
-                name="Grep",
-                description="Search file contents with regex",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "pattern": {
-                            "type": "string",
-                            "description": "Regex pattern to search for",
-                        },
-                    },
-                    "required": ["pattern"],
-                },
-            ),
-            Tool(
-                id="WebSearch",
-                name="WebSearch",
-                description="Search the web for information",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            ),
-            Tool(
-                id="WebFetch",
-                name="WebFetch",
-                description="Fetch and process content from a URL",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "URL to fetch",
-                        },
-                        "prompt": {
-                            "type": "string",
-                            "description": "Prompt for processing the content",
-                        },
-                    },
-                    "required": ["url", "prompt"],
-                },
-            ),
-            Tool(
-                id="Task",
-                name="Task",
-                description="Launch a sub-agent for complex tasks",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "description": {
-                            "type": "string",
-                            "description": "Short description of the task",
-                        },
-                        "prompt": {
-                            "type": "string",
-                            "description": "Detailed task prompt",
-                        },
-                        "subagent_type": {
-                            "type": "string",
-                            "description": "Type of sub-agent to use",
-                        },
-                    },
-                    "required": ["description", "prompt", "subagent_type"],
-                },
-            ),
-            Tool(
-                id="TodoWrite",
-                name="TodoWrite",
-                description="Manage task list for tracking progress",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "todos": {
-                            "type": "array",
-                            "description": "List of todo items",
-                        },
-                    },
-                    "required": ["todos"],
-                },
-            ),
-            Tool(
-                id="NotebookEdit",
-                name="NotebookEdit",
-                description="Edit Jupyter notebook cells",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "notebook_path": {
-                            "type": "string",
-                            "description": "Absolute path to the notebook",
-                        },
-                        "new_source": {
-                            "type": "string",
-                            "description": "New cell source content",
-                        },
-                    },
-                    "required": ["notebook_path", "new_source"],
-                },
-            ),
-            Tool(
-                id="AskUserQuestion",
-                name="AskUserQuestion",
-                description="Ask the user a question during execution",
-                source="builtin",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "questions": {
-                            "type": "array",
-                            "description": "List of questions to ask",
-                        },
-                    },
-                    "required": ["questions"],
-                },
-            ),
-        ]
+        return list(_BUILTIN_TOOLS)
 
     async def register_tool(self, tool: ToolDefinition) -> None:
         """
@@ -540,3 +627,157 @@ class ClaudeCodeAdapter(HarnessAdapter):
     async def close(self) -> None:
         """Clean up adapter resources."""
         pass  # No persistent connections to close
+
+
+def _tool_result_events(block: Any) -> tuple[ToolResultEvent, ToolCallEndEvent]:
+    """Events reporting a tool's result and the end of its call."""
+    return (
+        ToolResultEvent(
+            id=block.tool_use_id,
+            success=not block.is_error,
+            output=block.content,
+            error=None if not block.is_error else str(block.content),
+        ),
+        ToolCallEndEvent(id=block.tool_use_id),
+    )
+
+
+# How many SDK messages may be read ahead of the event translation
+_PREFETCH_MESSAGES = 64
+
+
+async def _prefetch(
+    source: AsyncGenerator[Any, None],
+    maxsize: int,
+    cancelled: asyncio.Event,
+) -> AsyncGenerator[Any, None]:
+    """
+    Read up to `maxsize` items of `source` ahead of the consumer.
+
+    A background task drains the source into a bounded queue, so SDK I/O
+    overlaps with translating and forwarding earlier messages; once the
+    queue is full the task waits for the consumer. Items arrive in order,
+    and an exception raised by the source is re-raised here after the
+    items read before it. The task, and with it the source, is cancelled
+    and awaited when the consumer stops early.
+
+    Setting `cancelled` ends the iteration even while the consumer is
+    waiting for the source's next item.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize)
+    end = object()
+    error: Exception | None = None
+
+    def wake(_: asyncio.Task[Any]) -> None:
+        # A full queue means the consumer is not waiting; it checks
+        # `cancelled` itself before handling the next item
+        with contextlib.suppress(asyncio.QueueFull):
+            queue.put_nowait(end)
+
+    async def pump() -> None:
+        nonlocal error
+        try:
+            async with aclosing(source) as items:
+                async for item in items:
+                    await queue.put(item)
+        except Exception as e:
+            error = e
+        await queue.put(end)
+
+    task = asyncio.create_task(pump())
+    waiter = asyncio.create_task(cancelled.wait())
+    waiter.add_done_callback(wake)
+    try:
+        while True:
+            item = await queue.get()
+            if item is end:
+                break
+            yield item
+        if error is not None and not cancelled.is_set():
+            raise error
+    finally:
+        waiter.remove_done_callback(wake)
+        waiter.cancel()
+        task.cancel()
+        # Let the source finish its cleanup before the stream returns
+        await asyncio.wait({waiter, task})
+
+
+_TOOL_EVENT_TYPES = frozenset({"tool_call_start", "tool_call_end", "tool_result"})
+
+
+async def _batch_tool_events(
+    events: AsyncGenerator[ExecutionEvent, None],
+    interval: float,
+    cancelled: asyncio.Event,
+    maxsize: int = _PREFETCH_MESSAGES,
+) -> AsyncGenerator[ExecutionEvent, None]:
+    """
+    Coalesce consecutive tool events into ToolEventBatchEvent.
+
+    Tool events are buffered and flushed as one batch when any other event
+    arrives, when the stream ends, or `interval` seconds after the first
+    buffered event, whichever comes first. Other events pass through
+    unchanged and in order. The source is drained by a background task so
+    the flush timer fires even while the SDK is waiting on a long tool;
+    the task reads at most `maxsize` events ahead of the consumer, and is
+    cancelled and awaited, closing the source, when the consumer stops early.
+
+    Once `cancelled` is set the buffer is discarded and only the final
+    DoneEvent is passed through, even if the source had already run ahead.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize)
+    end = object()
+    error: Exception | None = None
+
+    async def pump() -> None:
+        nonlocal error
+        try:
+            async with aclosing(events) as items:
+                async for event in items:
+                    await queue.put(event)
+        except Exception as e:
+            error = e
+        await queue.put(end)
+
+    loop = asyncio.get_running_loop()
+    task = asyncio.create_task(pump())
+    buffer: list[Any] = []
+    deadline: float | None = None
+
+    try:
+        while True:
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                if not cancelled.is_set():
+                    yield ToolEventBatchEvent(events=buffer)
+                buffer, deadline = [], None
+                continue
+
+            if event is end:
+                break
+            if cancelled.is_set():
+                buffer, deadline = [], None
+                if event.type == "done":
+                    yield event
+                continue
+            if event.type in _TOOL_EVENT_TYPES:
+                buffer.append(event)
+                if deadline is None:
+                    deadline = loop.time() + interval
+                continue
+            if buffer:
+                yield ToolEventBatchEvent(events=buffer)
+                buffer, deadline = [], None
+            yield event
+
+        if buffer and not cancelled.is_set():
+            yield ToolEventBatchEvent(events=buffer)
+        if error is not None:
+            raise error
+    finally:
+        task.cancel()
+        # Let the source finish its cleanup before the stream returns
+        await asyncio.wait({task})
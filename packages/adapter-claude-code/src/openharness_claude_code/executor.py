@@ -3,26 +3,28 @@ Executor for Claude Agent SDK operations.
 
 Handles the actual communication with the Claude Agent SDK,
 using the real SDK types and API.
+
+The SDK is imported on first use rather than at module import, since it
+pulls in the MCP client and dominates this package's import time.
 """
 
-from typing import Any, AsyncIterator
-
-from claude_agent_sdk import (
-    AssistantMessage,
-    ClaudeAgentOptions,
-    CLINotFoundError,
-    ProcessError,
-    ResultMessage,
-    SystemMessage,
-    TextBlock,
-    ThinkingBlock,
-    ToolResultBlock,
-    ToolUseBlock,
-    query,
-)
+from __future__ import annotations
+
+import asyncio
+import functools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncGenerator, NamedTuple
 
 from .types import ClaudeCodeConfig
 
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeAgentOptions
+
+
+# Longest stretch (seconds) the relay loop may hold the event loop while the
+# SDK delivers a burst of already-buffered messages.
+_CHECKPOINT_INTERVAL = 0.005
+
 
 class ClaudeCodeExecutor:
     """
@@ -40,10 +42,23 @@ class ClaudeCodeExecutor:
             config: Default configuration for executions.
         """
         self._config = config or ClaudeCodeConfig()
+        self._cached_options: tuple[tuple[Any, ...], ClaudeAgentOptions] | None = None
 
     def _build_options(self, config: ClaudeCodeConfig) -> ClaudeAgentOptions:
-        """Build ClaudeAgentOptions from our config."""
-        return ClaudeAgentOptions(
+        """
+        Build ClaudeAgentOptions from our config.
+
+        The result is reused while the config's settings are unchanged,
+        which is the common case of one adapter running many prompts. The
+        SDK never mutates the options it is given, so sharing is safe.
+        """
+        key = _options_key(config)
+        if self._cached_options is not None and self._cached_options[0] == key:
+            return self._cached_options[1]
+
+        from claude_agent_sdk import ClaudeAgentOptions
+
+        options = ClaudeAgentOptions(
             cwd=config.cwd,
             model=config.model,
             system_prompt=config.system_prompt,
@@ -53,12 +68,14 @@ class ClaudeCodeExecutor:
             max_turns=config.max_turns,
             env=config.env if config.env else {},
         )
+        self._cached_options = (key, options)
+        return options
 
     async def execute(
         self,
         prompt: str,
         config: ClaudeCodeConfig | None = None,
-    ) -> AsyncIterator[Any]:
+    ) -> AsyncGenerator[Any, None]:
         """
         Execute a prompt using the Claude Agent SDK.
 
@@ -69,12 +86,23 @@ class ClaudeCodeExecutor:
         Yields:
             Message objects from the SDK stream.
         """
+        from claude_agent_sdk import CLINotFoundError, ProcessError, query
+
         effective_config = config or self._config
         options = self._build_options(effective_config)
 
+        loop = asyncio.get_running_loop()
+        last_checkpoint = loop.time()
+
         try:
             async for message in query(prompt=prompt, options=options):
                 yield message
+
+                # Let other tasks (UI updates, heartbeats, cancellation) run
+                # if this burst has not given up the loop for a while
+                if loop.time() - last_checkpoint > _CHECKPOINT_INTERVAL:
+                    await asyncio.sleep(0)
+                    last_checkpoint = loop.time()
         except CLINotFoundError as e:
             raise RuntimeError(
                 "Claude Code CLI not found. Install with: npm install -g @anthropic-ai/claude-code"
@@ -83,12 +111,96 @@ class ClaudeCodeExecutor:
             raise RuntimeError(f"Claude Code process error: {e}") from e
 
 
+def _options_key(config: ClaudeCodeConfig) -> tuple[Any, ...]:
+    """
+    Hashable snapshot of the settings _build_options reads.
+
+    MCP server configs may be unhashable SDK objects, so they are keyed by
+    name and identity: adding, removing or replacing a server is detected,
+    editing a server's config in place is not.
+    """
+    return (
+        config.cwd,
+        config.model,
+        config.system_prompt,
+        tuple(config.allowed_tools),
+        config.permission_mode,
+        tuple((name, id(server)) for name, server in config.mcp_servers.items()),
+        config.max_turns,
+        tuple(config.env.items()),
+    )
+
+
+class _SdkTypes(NamedTuple):
+    """The SDK message and block classes the helpers below dispatch on."""
+
+    AssistantMessage: type[Any]
+    SystemMessage: type[Any]
+    ResultMessage: type[Any]
+    TextBlock: type[Any]
+    ThinkingBlock: type[Any]
+    ToolUseBlock: type[Any]
+    ToolResultBlock: type[Any]
+
+
+@functools.cache
+def _sdk_types() -> _SdkTypes:
+    """Import the SDK classes once, on first use."""
+    import claude_agent_sdk as sdk
+
+    return _SdkTypes(*(getattr(sdk, name) for name in _SdkTypes._fields))
+
+
+@dataclass(slots=True)
+class MessageView:
+    """The content blocks of one message, split by kind."""
+
+    texts: list[str] = field(default_factory=list)
+    thinkings: list[str] = field(default_factory=list)
+    tool_uses: list[dict[str, Any]] = field(default_factory=list)
+    tool_results: list[dict[str, Any]] = field(default_factory=list)
+
+
+def classify_message(message: Any) -> MessageView:
+    """
+    Split a message's content blocks by kind in a single pass.
+
+    Non-assistant messages and assistant messages without content give an
+    empty view. Prefer this over calling several extract_* helpers on the
+    same message, each of which walks the content again.
+    """
+    sdk = _sdk_types()
+    view = MessageView()
+    if not isinstance(message, sdk.AssistantMessage) or not message.content:
+        return view
+
+    for block in message.content:
+        if type(block) is sdk.TextBlock:
+            view.texts.append(block.text)
+        elif type(block) is sdk.ThinkingBlock:
+            view.thinkings.append(block.thinking)
+        elif type(block) is sdk.ToolUseBlock:
+            view.tool_uses.append({
+                "id": block.id,
+                "name": block.name,
+                "input": block.input,
+            })
+        elif type(block) is sdk.ToolResultBlock:
+            view.tool_results.append({
+                "tool_use_id": block.tool_use_id,
+                "content": block.content,
+                "is_error": block.is_error,
+            })
+    return view
+
+
 def extract_text_from_message(message: Any) -> str | None:
     """Extract text content from a message."""
-    if isinstance(message, AssistantMessage):
+    sdk = _sdk_types()
+    if isinstance(message, sdk.AssistantMessage):
         texts = []
         for block in message.content:
-            if isinstance(block, TextBlock):
+            if isinstance(block, sdk.TextBlock):
                 texts.append(block.text)
         return "".join(texts) if texts else None
     return None
@@ -96,19 +208,22 @@ def extract_text_from_message(message: Any) -> str | None:
 
 def extract_thinking_from_message(message: Any) -> str | None:
     """Extract thinking content from a message."""
-    if isinstance(message, AssistantMessage):
+    sdk = _sdk_types()
+    if isinstance(message, sdk.AssistantMessage):
         for block in message.content:
-            if isinstance(block, ThinkingBlock):
-                return block.thinking
+            if isinstance(block, sdk.ThinkingBlock):
+                thinking: str = block.thinking
+                return thinking
     return None
 
 
 def extract_tool_use_from_message(message: Any) -> list[dict[str, Any]]:
     """Extract tool use blocks from a message."""
+    sdk = _sdk_types()
     tool_uses = []
-    if isinstance(message, AssistantMessage):
+    if isinstance(message, sdk.AssistantMessage):
         for block in message.content:
-            if isinstance(block, ToolUseBlock):
+            if isinstance(block, sdk.ToolUseBlock):
                 tool_uses.append({
                     "id": block.id,
                     "name": block.name,
@@ -119,10 +234,11 @@ def extract_tool_use_from_message(message: Any) -> list[dict[str, Any]]:
 
 def extract_tool_result_from_message(message: Any) -> list[dict[str, Any]]:
     """Extract tool result blocks from a message."""
+    sdk = _sdk_types()
     results = []
-    if isinstance(message, AssistantMessage):
+    if isinstance(message, sdk.AssistantMessage):
         for block in message.content:
-            if isinstance(block, ToolResultBlock):
+            if isinstance(block, sdk.ToolResultBlock):
                 results.append({
                     "tool_use_id": block.tool_use_id,
                     "content": block.content,
@@ -133,7 +249,7 @@ def extract_tool_result_from_message(message: Any) -> list[dict[str, Any]]:
 
 def extract_usage_from_result(message: Any) -> dict[str, Any] | None:
     """Extract usage stats from a ResultMessage."""
-    if isinstance(message, ResultMessage):
+    if type(message) is _sdk_types().ResultMessage:
         return {
             "duration_ms": message.duration_ms,
             "duration_api_ms": message.duration_api_ms,
@@ -147,10 +263,11 @@ def extract_usage_from_result(message: Any) -> dict[str, Any] | None:
 
 def get_message_type(message: Any) -> str:
     """Get the type name of a message."""
-    if isinstance(message, AssistantMessage):
+    sdk = _sdk_types()
+    if isinstance(message, sdk.AssistantMessage):
         return "assistant"
-    elif isinstance(message, SystemMessage):
+    elif isinstance(message, sdk.SystemMessage):
         return "system"
-    elif isinstance(message, ResultMessage):
+    elif isinstance(message, sdk.ResultMessage):
         return "result"
     return type(message).__name__.lower()
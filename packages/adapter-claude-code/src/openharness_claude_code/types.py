@@ -4,7 +4,7 @@ Type definitions for the Claude Code adapter.
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ClaudeCodeConfig(BaseModel):
@@ -24,8 +24,15 @@ class ClaudeCodeConfig(BaseModel):
         mcp_servers: Dictionary of MCP server configurations.
         max_turns: Maximum number of conversation turns before stopping.
         env: Additional environment variables to pass to the SDK.
+        flush_interval_ms: When > 0, execute_stream() coalesces consecutive tool
+            events into ToolEventBatchEvent, flushed at most this many ms after
+            the first buffered event. 0 (default) yields each event as it occurs.
+
+    Configs are immutable; use model_copy(update=...) to derive a changed one.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     model: str | None = None
     cwd: str | None = None
     system_prompt: str | None = None
@@ -34,6 +41,7 @@ class ClaudeCodeConfig(BaseModel):
     mcp_servers: dict[str, Any] = Field(default_factory=dict)
     max_turns: int | None = None
     env: dict[str, str] = Field(default_factory=dict)
+    flush_interval_ms: int = Field(default=0, ge=0)
 
 
 class SessionInfo(BaseModel):
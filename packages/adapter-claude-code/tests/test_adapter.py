@@ -4,10 +4,23 @@ These tests verify the adapter works correctly with the real Claude Agent SDK.
 Some tests require Claude Code CLI to be installed.
 """
 
+import asyncio
 import os
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from claude_agent_sdk import (
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+from openharness.types import ExecuteRequest, UsageStats
+from pydantic import ValidationError
 
 from openharness_claude_code import (
     ClaudeCodeAdapter,
@@ -33,6 +46,15 @@ class TestClaudeCodeConfig:
         assert config.max_turns is None
         assert config.env == {}
 
+    def test_config_is_frozen(self):
+        """Test that config fields cannot be reassigned."""
+        config = ClaudeCodeConfig(model="sonnet")
+
+        with pytest.raises(ValidationError):
+            config.model = "opus"
+
+        assert config.model_copy(update={"model": "opus"}).model == "opus"
+
     def test_custom_config(self):
         """Test custom configuration values."""
         config = ClaudeCodeConfig(
@@ -143,6 +165,18 @@ class TestClaudeCodeAdapter:
         assert "NotebookEdit" in tool_names
         assert "AskUserQuestion" in tool_names
 
+    def test_sdk_not_imported_until_execution(self):
+        """Test that listing tools and capabilities does not load the SDK."""
+        code = (
+            "import asyncio, sys\n"
+            "from openharness_claude_code import ClaudeCodeAdapter\n"
+            "adapter = ClaudeCodeAdapter()\n"
+            "asyncio.run(adapter.list_tools())\n"
+            "asyncio.run(adapter.get_capability_manifest())\n"
+            "assert 'claude_agent_sdk' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     @pytest.mark.asyncio
     async def test_list_tools_schema(self):
         """Test that tools have proper input_schema definitions."""
@@ -160,6 +194,15 @@ class TestClaudeCodeAdapter:
         assert "file_path" in schema["properties"]
         assert "file_path" in schema["required"]
 
+    @pytest.mark.asyncio
+    async def test_list_tools_returns_new_list(self):
+        """Test that callers can modify the returned list without affecting later calls."""
+        adapter = ClaudeCodeAdapter()
+        tools = await adapter.list_tools()
+        tools.clear()
+
+        assert len(await adapter.list_tools()) == 12
+
     @pytest.mark.asyncio
     async def test_get_capability_manifest(self):
         """Test capability manifest generation."""
@@ -227,6 +270,498 @@ class TestClaudeCodeExecutor:
         assert options.permission_mode == "bypassPermissions"
         assert options.max_turns == 5
 
+    def test_build_options_reused_for_same_config(self):
+        """Test that options are built once while the config is unchanged."""
+        config = ClaudeCodeConfig(model="sonnet", allowed_tools=["Read"])
+        executor = ClaudeCodeExecutor(config)
+
+        first = executor._build_options(config)
+
+        assert executor._build_options(config) is first
+        same = ClaudeCodeConfig(model="sonnet", allowed_tools=["Read"])
+        assert executor._build_options(same) is first
+
+    def test_build_options_rebuilt_after_change(self):
+        """Test that changing a setting produces fresh options."""
+        config = ClaudeCodeConfig(model="sonnet")
+        executor = ClaudeCodeExecutor(config)
+        first = executor._build_options(config)
+
+        second = executor._build_options(config.model_copy(update={"allowed_tools": ["Bash"]}))
+
+        assert second is not first
+        assert second.allowed_tools == ["Bash"]
+        assert executor._build_options(ClaudeCodeConfig(model="opus")).model == "opus"
+
+    @pytest.mark.asyncio
+    async def test_execute_yields_to_event_loop_during_bursts(self):
+        """Test that a burst of SDK messages does not starve other tasks."""
+        import time
+
+        async def busy_query(prompt, options):
+            for i in range(20):
+                time.sleep(0.001)  # CPU-bound work, never awaits
+                yield i
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        executor = ClaudeCodeExecutor()
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        ticks = 0
+        with patch("claude_agent_sdk.query", busy_query):
+            messages = [m async for m in executor.execute("hi")]
+        task.cancel()
+
+        assert messages == list(range(20))
+        assert ticks > 0
+
+    def test_classify_message(self):
+        """Test that one pass splits content blocks by kind."""
+        from openharness_claude_code.executor import (
+            classify_message,
+            extract_text_from_message,
+            extract_tool_result_from_message,
+        )
+
+        message = _tool_round_messages()[0]
+        view = classify_message(message)
+
+        assert view.texts == ["Looking around.", "Done."]
+        assert view.thinkings == []
+        assert [t["id"] for t in view.tool_uses] == ["t1", "t2"]
+        assert [r["tool_use_id"] for r in view.tool_results] == ["t1", "t2"]
+        assert extract_text_from_message(message) == "Looking around.Done."
+        assert extract_tool_result_from_message(_tool_round_messages()[-1]) == []
+
+    def test_get_message_type(self):
+        """Test canonical message type names, with a class-name fallback."""
+        from openharness_claude_code.executor import get_message_type
+
+        assert get_message_type(AssistantMessage(content=[], model="sonnet")) == "assistant"
+        assert get_message_type(_tool_round_messages()[-1]) == "result"
+        assert get_message_type(TextBlock(text="x")) == "textblock"
+
+        class StreamedAssistantMessage(AssistantMessage):
+            pass
+
+        message = StreamedAssistantMessage(content=[], model="sonnet")
+        assert get_message_type(message) == "assistant"
+
+
+def _stream_from(*messages, delay: float = 0.0):
+    """Build a fake executor.execute that yields SDK messages in order."""
+
+    async def execute(prompt, config=None):
+        for message in messages:
+            if delay:
+                await asyncio.sleep(delay)
+            yield message
+
+    return execute
+
+
+def _tool_round_messages():
+    """An assistant turn with text, two tool uses and their results, then a result."""
+    return (
+        AssistantMessage(
+            content=[
+                TextBlock(text="Looking around."),
+                ToolUseBlock(id="t1", name="Glob", input={"pattern": "*.py"}),
+                ToolUseBlock(id="t2", name="Read", input={"file_path": "/a.py"}),
+                ToolResultBlock(tool_use_id="t1", content="a.py", is_error=False),
+                ToolResultBlock(tool_use_id="t2", content="print()", is_error=False),
+                TextBlock(text="Done."),
+            ],
+            model="sonnet",
+        ),
+        ResultMessage(
+            subtype="success",
+            duration_ms=10,
+            duration_api_ms=8,
+            is_error=False,
+            num_turns=1,
+            session_id="sess",
+            usage={"input_tokens": 3, "output_tokens": 4},
+        ),
+    )
+
+
+class TestExecuteStream:
+    """Tests for translating SDK messages into execution events."""
+
+    @pytest.mark.asyncio
+    async def test_events_unbatched_by_default(self):
+        """Test that each block yields its own event when batching is off."""
+        adapter = ClaudeCodeAdapter()
+        adapter._executor.execute = _stream_from(*_tool_round_messages())
+
+        events = [e async for e in adapter.execute_stream(ExecuteRequest(message="hi"))]
+
+        assert [e.type for e in events] == [
+            "text",
+            "tool_call_start",
+            "tool_call_start",
+            "tool_result",
+            "tool_call_end",
+            "tool_result",
+            "tool_call_end",
+            "text",
+            "done",
+        ]
+        assert [e.id for e in events if e.type == "tool_call_end"] == ["t1", "t2"]
+        assert events[-1].usage.total_tokens == 7
+
+    @pytest.mark.asyncio
+    async def test_empty_assistant_message_skipped(self):
+        """Test that an assistant message without content yields no events."""
+        adapter = ClaudeCodeAdapter()
+        adapter._executor.execute = _stream_from(
+            AssistantMessage(content=[], model="sonnet"),
+            *_tool_round_messages(),
+        )
+
+        events = [e async for e in adapter.execute_stream(ExecuteRequest(message="hi"))]
+
+        assert events[0].type == "text"
+        assert len(events) == 9
+
+    @pytest.mark.asyncio
+    async def test_tool_result_in_user_message(self):
+        """Test that a tool ends as soon as the SDK reports its result in a UserMessage."""
+        adapter = ClaudeCodeAdapter()
+        adapter._executor.execute = _stream_from(
+            AssistantMessage(
+                content=[ToolUseBlock(id="t1", name="Glob", input={"pattern": "*.py"})],
+                model="sonnet",
+            ),
+            UserMessage(
+                content=[ToolResultBlock(tool_use_id="t1", content="a.py", is_error=False)],
+            ),
+            AssistantMessage(content=[TextBlock(text="Found a.py.")], model="sonnet"),
+            UserMessage(content="plain user text"),
+            _tool_round_messages()[-1],
+        )
+
+        events = [e async for e in adapter.execute_stream(ExecuteRequest(message="hi"))]
+
+        assert [(e.type, getattr(e, "id", None)) for e in events] == [
+            ("tool_call_start", "t1"),
+            ("tool_result", "t1"),
+            ("tool_call_end", "t1"),
+            ("text", None),
+            ("done", None),
+        ]
+        assert events[1].output == "a.py"
+
+    @pytest.mark.asyncio
+    async def test_unfinished_tools_ended_on_result(self):
+        """Test that tools without a result are ended once when the run completes."""
+        adapter = ClaudeCodeAdapter()
+        adapter._executor.execute = _stream_from(
+            AssistantMessage(
+                content=[
+                    ToolUseBlock(id="t1", name="Glob", input={}),
+                    ToolUseBlock(id="t2", name="Read", input={}),
+                ],
+                model="sonnet",
+            ),
+            _tool_round_messages()[-1],
+        )
+
+        events = [e async for e in adapter.execute_stream(ExecuteRequest(message="hi"))]
+
+        assert [(e.type, getattr(e, "id", None)) for e in events] == [
+            ("tool_call_start", "t1"),
+            ("tool_call_start", "t2"),
+            ("tool_call_end", "t1"),
+            ("tool_call_end", "t2"),
+            ("done", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sdk_read_ahead_while_consumer_busy(self):
+        """Test that SDK messages are read ahead while the consumer is slow."""
+        adapter = ClaudeCodeAdapter()
+        read = 0
+
+        async def execute(prompt, config=None):
+            nonlocal read
+            for i in range(3):
+                read += 1
+                yield AssistantMessage(content=[TextBlock(text=str(i))], model="sonnet")
+
+        adapter._executor.execute = execute
+
+        stream = adapter.execute_stream(ExecuteRequest(message="hi"))
+        first = await stream.__anext__()
+        await asyncio.sleep(0.01)
+
+        assert first.content == "0"
+        assert read == 3
+        assert [e.content async for e in stream] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_sdk_cleanup_finished_when_stream_closed(self):
+        """Test that closing the stream waits for the SDK stream's cleanup."""
+        adapter = ClaudeCodeAdapter()
+        cleaned_up = False
+
+        async def execute(prompt, config=None):
+            nonlocal cleaned_up
+            try:
+                for i in range(100):
+                    yield AssistantMessage(content=[TextBlock(text=str(i))], model="sonnet")
+            finally:
+                await asyncio.sleep(0.01)
+                cleaned_up = True
+
+        adapter._executor.execute = execute
+
+        stream = adapter.execute_stream(ExecuteRequest(message="hi"))
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert cleaned_up
+
+    @pytest.mark.asyncio
+    async def test_error_after_messages_reported_in_order(self):
+        """Test that a failing SDK stream still delivers the messages read before."""
+        adapter = ClaudeCodeAdapter()
+
+        async def execute(prompt, config=None):
+            yield AssistantMessage(content=[TextBlock(text="partial")], model="sonnet")
+            raise RuntimeError("Claude Code process error: exit 1")
+
+        adapter._executor.execute = execute
+
+        events = [e async for e in adapter.execute_stream(ExecuteRequest(message="hi"))]
+
+        assert [e.type for e in events] == ["text", "error"]
+        assert events[1].code == "execution_error"
+
+    @pytest.mark.asyncio
+    async def test_zero_usage(self):
+        """Test that a turn with no tokens and no duration reports zero usage."""
+        adapter = ClaudeCodeAdapter()
+        adapter._executor.execute = _stream_from(
+            ResultMessage(
+                subtype="success",
+                duration_ms=0,
+                duration_api_ms=0,
+                is_error=False,
+                num_turns=1,
+                session_id="s1",
+                usage={"input_tokens": 0},
+            ),
+        )
+
+        events = [e async for e in adapter.execute_stream(ExecuteRequest(message="hi"))]
+
+        assert events[-1].usage == UsageStats(
+            input_tokens=0, output_tokens=0, total_tokens=0, duration_ms=0
+        )
+
+        # Each turn gets its own instance, so mutating one cannot leak into the next
+        events[-1].usage.input_tokens = 99
+        again = [e async for e in adapter.execute_stream(ExecuteRequest(message="hi"))]
+        assert again[-1].usage.input_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_reported(self):
+        """Test that an unexpected exception becomes an ErrorEvent naming its type."""
+        adapter = ClaudeCodeAdapter()
+
+        async def failing_execute(prompt, config=None):
+            raise ValueError("boom")
+            yield
+
+        adapter._executor.execute = failing_execute
+
+        events = [e async for e in adapter.execute_stream(ExecuteRequest(message="hi"))]
+
+        assert len(events) == 1
+        assert events[0].code == "unknown_error"
+        assert events[0].message == "ValueError: boom"
+
+    @pytest.mark.asyncio
+    async def test_tool_events_batched(self):
+        """Test that consecutive tool events are coalesced between other events."""
+        adapter = ClaudeCodeAdapter(ClaudeCodeConfig(flush_interval_ms=50))
+        adapter._executor.execute = _stream_from(*_tool_round_messages())
+
+        events = [e async for e in adapter.execute_stream(ExecuteRequest(message="hi"))]
+
+        assert [e.type for e in events] == ["text", "tool_event_batch", "text", "done"]
+        batch = events[1]
+        assert [e.type for e in batch.events] == [
+            "tool_call_start",
+            "tool_call_start",
+            "tool_result",
+            "tool_call_end",
+            "tool_result",
+            "tool_call_end",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_tool_batch_flushed_on_interval(self):
+        """Test that a pending batch is flushed without waiting for the next message."""
+        adapter = ClaudeCodeAdapter(ClaudeCodeConfig(flush_interval_ms=10))
+        adapter._executor.execute = _stream_from(
+            AssistantMessage(
+                content=[ToolUseBlock(id="t1", name="Bash", input={"command": "sleep 1"})],
+                model="sonnet",
+            ),
+            AssistantMessage(content=[TextBlock(text="ok")], model="sonnet"),
+            delay=0.2,
+        )
+
+        stream = adapter.execute_stream(ExecuteRequest(message="hi"))
+        first = await asyncio.wait_for(stream.__anext__(), timeout=0.35)
+
+        assert first.type == "tool_event_batch"
+        assert [e.type for e in first.events] == ["tool_call_start"]
+        assert [e.type async for e in stream] == ["text"]
+
+    @pytest.mark.asyncio
+    async def test_tool_batching_bounds_read_ahead(self):
+        """Test that batching keeps the SDK from running far ahead of a slow consumer."""
+        adapter = ClaudeCodeAdapter(ClaudeCodeConfig(flush_interval_ms=50))
+        read = 0
+
+        async def execute(prompt, config=None):
+            nonlocal read
+            for i in range(1000):
+                read += 1
+                yield AssistantMessage(content=[TextBlock(text=str(i))], model="sonnet")
+
+        adapter._executor.execute = execute
+
+        stream = adapter.execute_stream(ExecuteRequest(message="hi"))
+        await stream.__anext__()
+        await asyncio.sleep(0.05)
+
+        assert read < 200
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_tool_batching_closes_source_on_early_exit(self):
+        """Test that leaving a batched stream early finishes the SDK stream's cleanup."""
+        adapter = ClaudeCodeAdapter(ClaudeCodeConfig(flush_interval_ms=50))
+        cleaned_up = False
+
+        async def execute(prompt, config=None):
+            nonlocal cleaned_up
+            try:
+                for i in range(1000):
+                    yield AssistantMessage(content=[TextBlock(text=str(i))], model="sonnet")
+            finally:
+                await asyncio.sleep(0.01)
+                cleaned_up = True
+
+        adapter._executor.execute = execute
+
+        stream = adapter.execute_stream(ExecuteRequest(message="hi"))
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert cleaned_up
+
+    @pytest.mark.asyncio
+    async def test_execute_ignores_batching(self):
+        """Test that execute() still sees individual tool calls when batching is on."""
+        adapter = ClaudeCodeAdapter(ClaudeCodeConfig(flush_interval_ms=50))
+        adapter._executor.execute = _stream_from(*_tool_round_messages())
+
+        result = await adapter.execute(ExecuteRequest(message="hi"))
+
+        assert result.output == "Looking around.Done."
+        assert [tc["id"] for tc in result.tool_calls] == ["t1", "t2"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_pending_events(self):
+        """Test that cancel() ends the stream with a single usage-less DoneEvent."""
+        adapter = ClaudeCodeAdapter()
+        adapter._executor.execute = _stream_from(*_tool_round_messages())
+
+        events = []
+        async for event in adapter.execute_stream(ExecuteRequest(message="hi")):
+            events.append(event)
+            if event.type == "tool_call_start":
+                adapter.cancel()
+
+        assert [e.type for e in events] == ["text", "tool_call_start", "done"]
+        assert events[-1].usage is None
+
+    @pytest.mark.asyncio
+    async def test_cancel_discards_tool_batch(self):
+        """Test that buffered tool events never reach the consumer after cancel()."""
+        adapter = ClaudeCodeAdapter(ClaudeCodeConfig(flush_interval_ms=50))
+        adapter._executor.execute = _stream_from(*_tool_round_messages())
+
+        events = []
+        async for event in adapter.execute_stream(ExecuteRequest(message="hi")):
+            events.append(event)
+            if event.type == "text":
+                adapter.cancel()
+
+        assert [e.type for e in events] == ["text", "done"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_before_first_iteration(self):
+        """Test that cancel() applies to a stream that has not started yet."""
+        adapter = ClaudeCodeAdapter()
+        adapter._executor.execute = _stream_from(*_tool_round_messages())
+
+        stream = adapter.execute_stream(ExecuteRequest(message="hi"))
+        adapter.cancel()
+
+        events = [e async for e in stream]
+
+        assert [e.type for e in events] == ["done"]
+        assert events[0].usage is None
+
+    @pytest.mark.asyncio
+    async def test_cancel_does_not_affect_later_streams(self):
+        """Test that a stream started after cancel() runs to completion."""
+        adapter = ClaudeCodeAdapter()
+        adapter._executor.execute = _stream_from(*_tool_round_messages())
+
+        first = adapter.execute_stream(ExecuteRequest(message="hi"))
+        adapter.cancel()
+        second = adapter.execute_stream(ExecuteRequest(message="hi"))
+
+        assert [e.type async for e in first] == ["done"]
+        events = [e async for e in second]
+        assert len(events) == 9
+        assert events[-1].usage.total_tokens == 7
+
+    @pytest.mark.asyncio
+    async def test_cancel_wakes_stream_waiting_on_sdk(self):
+        """Test that cancel() ends a stream blocked on the next SDK message."""
+        adapter = ClaudeCodeAdapter()
+        adapter._executor.execute = _stream_from(
+            AssistantMessage(content=[TextBlock(text="working")], model="sonnet"),
+            AssistantMessage(content=[TextBlock(text="late")], model="sonnet"),
+            delay=5,
+        )
+
+        stream = adapter.execute_stream(ExecuteRequest(message="hi"))
+        pending = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.05)
+        adapter.cancel()
+
+        event = await asyncio.wait_for(pending, timeout=1)
+        assert event.type == "done"
+        assert event.usage is None
+
 
 # Integration tests - require Claude Code CLI
 @pytest.mark.skipif(
@@ -20,6 +20,13 @@ export type ExecutionEvent =
       output?: object;
       error?: string;
     }
+  | {
+      type: "tool_event_batch";
+      events: Extract<
+        ExecutionEvent,
+        { type: "tool_call_start" | "tool_call_end" | "tool_result" }
+      >[];
+    }
   | {
       type: "artifact";
       id: string;
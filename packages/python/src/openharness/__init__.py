@@ -121,6 +121,7 @@ from .types import (
     ToolCallDeltaEvent,
     ToolCallEndEvent,
     ToolCallStartEvent,
+    ToolEventBatchEvent,
     ToolResultEvent,
     ToolStreamDataEvent,
     ToolStreamEndEvent,
@@ -231,6 +232,7 @@ __all__ = [
     "ToolCallDeltaEvent",
     "ToolCallEndEvent",
     "ToolResultEvent",
+    "ToolEventBatchEvent",
     "ProgressEvent",
     "ErrorEvent",
     "DoneEvent",
@@ -88,6 +88,7 @@ from .events import (
     ToolCallDeltaEvent,
     ToolCallEndEvent,
     ToolCallStartEvent,
+    ToolEventBatchEvent,
     ToolResultEvent,
     ToolStreamDataEvent,
     ToolStreamEndEvent,
@@ -189,6 +190,7 @@ __all__ = [
     "ToolCallDeltaEvent",
     "ToolCallEndEvent",
     "ToolResultEvent",
+    "ToolEventBatchEvent",
     "ProgressEvent",
     "ErrorEvent",
     "DoneEvent",
@@ -51,6 +51,12 @@ class ToolResultEvent(BaseModel):
     error: str | None = None
 
 
+class ToolEventBatchEvent(BaseModel):
+    """Consecutive tool events coalesced into one, in original order."""
+    type: Literal["tool_event_batch"] = "tool_event_batch"
+    events: list[ToolCallStartEvent | ToolCallEndEvent | ToolResultEvent]
+
+
 class ProgressEvent(BaseModel):
     """Execution progress update."""
     type: Literal["progress"] = "progress"
@@ -91,6 +97,7 @@ ExecutionEvent = Union[
     ToolCallDeltaEvent,
     ToolCallEndEvent,
     ToolResultEvent,
+    ToolEventBatchEvent,
     ProgressEvent,
     ErrorEvent,
     DoneEvent,